@@ -0,0 +1,222 @@
+"""
+File: arrayTree.py
+
+ Support Module for: Animate a Binary Search Tree using Python
+
+ Project home: http://www.embeddedcomponents.com/blogs/2013/12/visualizing-software-tree-structures/
+
+ Developed by Ron Fredericks, Video Technologist, at LectureMaker LLC, http://www.LectureMaker.com
+    MIT License, Copyright (c) 2013, Ron Fredericks
+    Free to use following these terms: http://opensource.org/licenses/MIT
+
+ Revision 4: 10/16/2026
+
+#############################################################
+# Class arrayTree
+#############################################################
+
+Store a binary search tree in parallel arrays, for trees of millions of keys.
+
+    Node i of the tree is: keys[i], with left[i], right[i] and parent[i] holding node indexes (-1 for no node).
+    The index arrays are python arrays of machine integers, so a node costs a few bytes in place of a python object,
+    and keys may be held in a python array as well, when every key is a number (example: keyTypecode='l').
+
+    tree.getRoot(), and the branches of any node, return arrayTreeNode objects: small views of one array index,
+    created on demand, with the same methods used by visualizeTree.py and treeLayout.py:
+        getValue()
+        getLeftBranch()
+        getRightBranch()
+        getParent()
+    Nodes are named by str(node), their key, the same as binaryTree nodes.
+    Nodes are never removed from an arrayTree, there is no delete() method.
+
+Public methods:
+    arrayTree(keyTypecode) - instantiate an empty tree, keys held in a list, or in an array of keyTypecode
+    insert()               - insert a key
+    lookup()               - find a key
+    getRoot()              - return the root node, or None for an empty tree
+    print_tree()           - print a sorted list of keys in the tree
+
+External functions to build a tree:
+    buildBalancedArrayTree() - generate a balanced tree from a sorted list, in linear time
+"""
+
+from array import array
+
+# History:
+#   Rev 4: 10/16/2026
+#       1) Create (this) arrayTree.py module: a binary search tree held in parallel key and index arrays.
+
+
+NO_NODE = -1    # index stored in left, right or parent for a missing node
+
+
+class arrayTree(object):
+    def __init__(self, keyTypecode=None):
+        self.keys = array(keyTypecode) if keyTypecode else []   # key of each node, by node index
+        self.left = array('l')      # index of each node's left branch, or NO_NODE
+        self.right = array('l')     # index of each node's right branch, or NO_NODE
+        self.parent = array('l')    # index of each node's parent, or NO_NODE for the root
+        self.root = NO_NODE         # index of the root node, or NO_NODE for an empty tree
+
+    def __len__(self):
+        return len(self.keys)
+
+    def node(self, index):
+        # Return a node object for a node index, or None for NO_NODE
+        if index == NO_NODE:
+            return None
+        return arrayTreeNode(self, index)
+
+    def getRoot(self):
+        return self.node(self.root)
+
+    def newNode(self, value, parent):
+        # Append a node with no branches, return its index
+        self.keys.append(value)
+        self.left.append(NO_NODE)
+        self.right.append(NO_NODE)
+        self.parent.append(parent)
+        return len(self.keys) - 1
+
+    def insert(self, value, index=None):
+        """
+        Insert new node with key set to value, below node index (default: the root)
+        Return inserted node object to caller, or None if node not inserted (when node was already present)
+        """
+        if self.root == NO_NODE:
+            self.root = self.newNode(value, NO_NODE)
+            return self.node(self.root)
+        keys, left, right = self.keys, self.left, self.right
+        i = self.root if index == None else index
+        while True:
+            if value < keys[i]:
+                if left[i] == NO_NODE:
+                    left[i] = self.newNode(value, i)
+                    return self.node(left[i])
+                i = left[i]
+            elif value > keys[i]:
+                if right[i] == NO_NODE:
+                    right[i] = self.newNode(value, i)
+                    return self.node(right[i])
+                i = right[i]
+            else:
+                return None
+
+    def lookup(self, value, index=None):
+        """
+        Lookup node containing key set to value, below node index (default: the root)
+        Returns node object to caller, or None if not found
+        """
+        keys, left, right = self.keys, self.left, self.right
+        i = self.root if index == None else index
+        while i != NO_NODE:
+            if value < keys[i]:
+                i = left[i]
+            elif value > keys[i]:
+                i = right[i]
+            else:
+                return self.node(i)
+        return None
+
+    def print_tree(self, index=None):
+        """
+        Print tree content inorder, below node index (default: the root)
+        """
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        i = self.root if index == None else index
+        while stack or i != NO_NODE:
+            if i != NO_NODE:
+                stack.append(i)
+                i = left[i]
+            else:
+                i = stack.pop()
+                print keys[i],
+                i = right[i]
+
+
+class arrayTreeNode(object):
+    # A view of one node of an arrayTree, with the node methods of binaryTree.
+    #    Two node objects for the same tree and index are equal, but may not be the same object.
+    __slots__ = ('tree', 'index')
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    def getValue(self):
+        return self.tree.keys[self.index]
+
+    def getLeftBranch(self):
+        return self.tree.node(self.tree.left[self.index])
+
+    def getRightBranch(self):
+        return self.tree.node(self.tree.right[self.index])
+
+    def getParent(self):
+        return self.tree.node(self.tree.parent[self.index])
+
+    def insert(self, value):
+        return self.tree.insert(value, self.index)
+
+    def lookup(self, value):
+        return self.tree.lookup(value, self.index)
+
+    def children_count(self, node):
+        """
+        Returns the number of children of a tree node object: 0, 1, 2
+        """
+        if node is None:
+            return None
+        return (self.tree.left[self.index] != NO_NODE) + (self.tree.right[self.index] != NO_NODE)
+
+    def print_tree(self):
+        self.tree.print_tree(self.index)
+
+    def __eq__(self, other):
+        return isinstance(other, arrayTreeNode) and self.tree is other.tree and self.index == other.index
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self.tree), self.index))
+
+    def __str__(self):
+        return str(self.getValue())
+
+
+def buildBalancedArrayTree(sortedList, keyTypecode=None):
+    """
+    Build a balanced arrayTree from a sorted list, in linear time.
+
+    Input:
+        sortedList: sorted list of keys, any sequence with len(), left unchanged,
+        keyTypecode: array typecode to hold the keys in (example: 'l' for integers), or None for a list.
+    Output:
+        arrayTree, with the same shape as buildBalancedTree() builds from the same list.
+
+    Node indexes are in key order: an in-order walk reads the arrays front to back.
+    """
+    tree = arrayTree(keyTypecode)
+    count = len(sortedList)
+    tree.keys.extend(sortedList)
+    tree.left = array('l', [NO_NODE]) * count
+    tree.right = array('l', [NO_NODE]) * count
+    tree.parent = array('l', [NO_NODE]) * count
+    # each stack entry: (start, end) index range of a subtree, its parent index, and the parent's branch array
+    stack = [(0, count, NO_NODE, None)]
+    while stack:
+        start, end, parent, branch = stack.pop()
+        if start >= end:
+            continue
+        middle = (start + end) // 2
+        if branch is None:
+            tree.root = middle
+        else:
+            branch[parent] = middle
+        tree.parent[middle] = parent
+        stack.append((middle+1, end, middle, tree.right))
+        stack.append((start, middle, middle, tree.left))
+    return tree
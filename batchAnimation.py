@@ -0,0 +1,235 @@
+"""
+File: batchAnimation.py
+
+ Command line tool for: Animate a Binary Search Tree using Python, pyDot, GraphViz
+
+ Project home: http://www.embeddedcomponents.com/blogs/2013/12/visualizing-software-tree-structures/
+
+ Developed by Ron Fredericks, Video Technologist, at LectureMaker LLC, http://www.LectureMaker.com
+    MIT License, Copyright (c) 2013, Ron Fredericks
+    Free to use following these terms: http://opensource.org/licenses/MIT
+
+ Revision 4: 10/16/2026
+
+#############################################################
+# Batch animation of many trees and searches, without Tkinter
+#############################################################
+
+Render the search animations listed in a scenario file, in a pool of worker processes, and print a throughput summary.
+
+    Usage:
+        python batchAnimation.py scenarios.json [--jobs 4] [--outputDir vidImages]
+
+    A scenario file is JSON text: a list of scenarios, with default values for every scenario (all optional but "scenarios").
+        {
+            "outputDir": "vidImages",
+            "output": "png",
+            "scenarios": [
+                {"name": "ints", "tree": [5,2,1,4,8,6,7,3], "searchMethod": "BFS", "targets": ["1", "7", "9"]},
+                {"name": "alpha", "tree": "abcdefghijklmnopqrstuvwxyz", "rootValue": "m", "treeClass": "avlTree",
+                 "searchMethod": ["DFS", "DFSOrdered"], "targets": ["j"], "output": "video"}
+            ]
+        }
+
+    Scenario values, same as the user controlled parameters of binarySearchTreeAnimationApp.py:
+        name          - base name of each file written, followed by the search method and target (example: ints_BFS_7_00001.png)
+        tree          - list of keys (or a string of one character keys)
+        rootValue     - None (the default) to build a balanced tree from the sorted keys, or the key of the root to insert keys in list order
+        treeClass     - "binaryTree" (the default), "slottedBinaryTree", or "avlTree" (see binaryTree.py)
+        searchMethod  - "DFS", "DFSOrdered", "BFS", or a list of these
+        targets       - list of keys to search for, each searched with each search method
+        output        - "png" for numbered png images (png2mpg4.bat), "manifest" for a frame manifest (see visualizeTree.writeFrameManifest()),
+                        "video" for an mpeg-4 video per search, or "log" for a search log per search, without rendering (see searchLog.py)
+        layoutEngine  - "dot" (the default) or "native" (see treeLayout.py)
+        renderBackend - "graphviz" (the default) or "pillow" (see treeRaster.py)
+        vidFrames     - video frames per step of a search, 1 by default
+        holdFrames    - video frames to show the full tree before, and after, each search, 3 by default
+        renderCache   - directory of a render cache shared by every worker (see renderCache.py), or None (the default)
+        renderCacheSize - bytes of png images held by the render cache, 256 MB by default
+
+    Each scenario is one tree: it is built, sketched and laid out once by a worker process,
+    then each of its searches starts again from the sketch (see visualizeTree.resetGraph()).
+
+Public functions:
+    loadScenarios() - read a scenario file, as a list of scenarios with default values applied
+    runScenario()   - animate each search of one scenario, return its counts and times
+    runBatch()      - animate every scenario in a pool of worker processes, print a throughput summary
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+
+import binaryTree
+import visualizeTree
+
+# History:
+#   Rev 4: 10/16/2026
+#       1) Create (this) batchAnimation.py command line tool: headless batch rendering of scenario files in a worker pool.
+#       2) Add the renderCache and renderCacheSize scenario values, and render cache hits and misses to the summary.
+
+
+SEARCH_METHODS = {'DFSOrdered': visualizeTree.DFSOrdered, 'DFS': visualizeTree.DFS, 'BFS': visualizeTree.BFS}
+TREE_CLASSES = {'binaryTree': binaryTree.binaryTree, 'slottedBinaryTree': binaryTree.slottedBinaryTree, 'avlTree': binaryTree.avlTree}
+OUTPUTS = ('png', 'manifest', 'video', 'log')
+
+SCENARIO_DEFAULTS = {
+    'rootValue': None,
+    'treeClass': 'binaryTree',
+    'searchMethod': 'BFS',
+    'targets': [],
+    'output': 'png',
+    'outputDir': '.',
+    'layoutEngine': 'dot',
+    'renderBackend': 'graphviz',
+    'vidFrames': 1,
+    'holdFrames': 3,
+    'renderCache': None,
+    'renderCacheSize': 256*1024*1024,
+}
+
+
+def loadScenarios(fileName, outputDir=None):
+    # Read a scenario file, apply the file's default values, then SCENARIO_DEFAULTS, to each scenario
+    #    outputDir, when set, replaces the output directory of every scenario
+    # Output: list of scenario dictionaries
+    with open(fileName) as f:
+        content = json.load(f)
+    defaults = dict(SCENARIO_DEFAULTS)
+    defaults.update([(key, value) for key, value in content.items() if key != 'scenarios'])
+    scenarios = []
+    for i, scenario in enumerate(content['scenarios']):
+        merged = dict(defaults)
+        merged.update(scenario)
+        merged.setdefault('name', 'scenario%03d' % (i + 1))
+        if outputDir != None:
+            merged['outputDir'] = outputDir
+        if isinstance(merged['searchMethod'], basestring):
+            merged['searchMethod'] = [merged['searchMethod']]
+        for searchName in merged['searchMethod']:
+            if searchName not in SEARCH_METHODS:
+                raise ValueError("Error: scenario " + merged['name'] + " has unknown search method " + searchName)
+        if merged['treeClass'] not in TREE_CLASSES:
+            raise ValueError("Error: scenario " + merged['name'] + " has unknown tree class " + merged['treeClass'])
+        if merged['output'] not in OUTPUTS:
+            raise ValueError("Error: scenario " + merged['name'] + " has unknown output " + merged['output'])
+        scenarios.append(merged)
+    return scenarios
+
+
+def buildTree(scenario):
+    # Build the tree of a scenario, as binarySearchTreeAnimationApp.py does
+    listForTree = list(scenario['tree'])
+    nodeClass = TREE_CLASSES[scenario['treeClass']]
+    if scenario['rootValue'] == None:
+        return binaryTree.buildBalancedTree(sorted(listForTree), nodeClass=nodeClass)
+    return binaryTree.buildUnbalancedTree(listForTree, scenario['rootValue'], nodeClass)
+
+
+def runScenario(scenario):
+    # Animate each search of one scenario: the tree is built, sketched and laid out once,
+    #    then each search (search method, target) starts again from the sketch.
+    # Output: dictionary of the scenario name, and its counts and times in seconds
+    startTime = time.time()
+    output = scenario['output']
+    fileDir = os.path.join(scenario['outputDir'], '')
+    if not os.path.isdir(fileDir):
+        try:
+            os.makedirs(fileDir)
+        except OSError:
+            pass   # made by another worker
+    root = buildTree(scenario)
+    vT = visualizeTree.visualizeTree(fileDir)
+    if output == 'log':
+        vT.setHeadless()
+    else:
+        vT.setLayoutEngine(scenario['layoutEngine'])
+        vT.setRenderBackend(scenario['renderBackend'])
+        vT.setFrameManifest(output == 'manifest')
+        if scenario['renderCache'] != None:
+            vT.setRenderCache(scenario['renderCache'], scenario['renderCacheSize'])
+        vT.searchTree(root, visualizeTree.sketchTree)
+    sketchTime = time.time() - startTime
+
+    result = {'name': scenario['name'], 'searches': 0, 'found': 0, 'frames': 0, 'sketchTime': sketchTime}
+    for searchName, target in itertools.product(scenario['searchMethod'], scenario['targets']):
+        vT.resetGraph()
+        vT.fileName = u'%s_%s_%s_' % (scenario['name'], searchName, target)
+        vT.fileCount = 0
+        vT.frameManifest = []
+        vT.setSearchLog()
+        vT.setFrameStore()   # the visualizeList of one search only
+        if output == 'video':
+            vT.setVideoEncoder(vT.fileName.rstrip('_') + '.mp4', writeImages=False)
+        vT.showFrame(scenario['holdFrames'])
+        vT.setVidFrames(scenario['vidFrames'])
+        if vT.searchTree(root, SEARCH_METHODS[searchName], target):
+            result['found'] += 1
+        vT.holdFrame(scenario['holdFrames'])
+        if output == 'manifest':
+            vT.writeFrameManifest()
+        elif output == 'video':
+            vT.finishVideo()
+        elif output == 'log':
+            vT.searchLog.save(fileDir + vT.fileName.rstrip('_') + '.json')
+        vT.flushGraph()
+        result['searches'] += 1
+        if output != 'log':
+            result['frames'] += vT.searchLog.getFrameCount()
+    if vT.renderCache:
+        result['cacheHits'] = vT.renderCache.hits
+        result['cacheMisses'] = vT.renderCache.misses
+    result['time'] = time.time() - startTime
+    return result
+
+
+def runBatch(scenarios, jobs=None):
+    # Animate every scenario in a pool of jobs worker processes (default: one per cpu), one scenario per task,
+    #    print a line for each scenario as it completes, and a throughput summary at the end
+    # Output: list of the results returned by runScenario()
+    startTime = time.time()
+    if jobs == None:
+        jobs = multiprocessing.cpu_count()
+    pool = None
+    if jobs > 1 and len(scenarios) > 1:
+        pool = multiprocessing.Pool(min(jobs, len(scenarios)))
+        results = pool.imap_unordered(runScenario, scenarios)
+    else:
+        results = itertools.imap(runScenario, scenarios)
+    completed = []
+    try:
+        for result in results:
+            completed.append(result)
+            print "%-24s %4d searches, %4d found, %6d frames, sketch %.2fs, total %.2fs" % (
+                result['name'], result['searches'], result['found'], result['frames'], result['sketchTime'], result['time'])
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    elapsed = time.time() - startTime
+    searches = sum([result['searches'] for result in completed])
+    frames = sum([result['frames'] for result in completed])
+    print "%d scenarios, %d searches, %d frames in %.2fs using %d worker(s):" % (
+        len(completed), searches, frames, elapsed, jobs if pool else 1),
+    print "%.1f searches/s, %.1f frames/s" % (searches / max(elapsed, 1e-9), frames / max(elapsed, 1e-9))
+    hits = sum([result.get('cacheHits', 0) for result in completed])
+    misses = sum([result.get('cacheMisses', 0) for result in completed])
+    if hits or misses:
+        print "render cache: %d hits, %d misses (%.0f%% hits)" % (hits, misses, 100. * hits / (hits + misses))
+    return completed
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Render binary search tree search animations listed in a scenario file.")
+    parser.add_argument('scenarioFile', help="JSON scenario file, see batchAnimation.py for its format")
+    parser.add_argument('--jobs', type=int, default=None, help="number of worker processes (default: one per cpu)")
+    parser.add_argument('--outputDir', default=None, help="directory for every file written, in place of the scenario file's")
+    options = parser.parse_args(args)
+    runBatch(loadScenarios(options.scenarioFile, options.outputDir), options.jobs)
+
+
+if __name__ == '__main__':
+    main()
@@ -50,6 +50,15 @@ Required Software:
                                 in this case, the binary tree and the search process.
         png2mpg4.bat      - Used to generate mpg4 video from a series of png graphic images, 
                                 in this case, the binary tree and the search process.
+        videoEncoder.py   - Used to generate mpg4 video while the search is animated, without png2mpg4.bat.
+        frameRenderer.py  - Used to render png graphic images in parallel, and in batches.
+        treeLayout.py     - Used to compute binary tree node positions without GraphViz's dot layout.
+        treeRaster.py     - Used to draw binary tree frames as images without GraphViz.
+        frameStore.py     - Used to hold animation frames in memory, for display with slideShow.py.
+        arrayTree.py      - Used to hold very large binary search trees in parallel arrays.
+        searchLog.py      - Used to record a search as events, to render it again later at any speed.
+        batchAnimation.py - Used to render many trees and searches from a scenario file, without Tkinter.
+        renderCache.py    - Used to reuse png graphic images rendered by GraphViz, from one run to the next.
 """
 
 # Local python libraries supplied with this project
@@ -144,10 +153,12 @@ fileDir = "C:\\Users\\Ron Fredericks\\Documents\\LectureMaker\\Projects\\MOOC\\E
 # Display 'sketch tree' and 'animate search' parameters
 if not rootValue:
     print "Generate a balanced tree with",   
-    root = binaryTree.buildBalancedTree(listForTree[:], 0, len(listForTree))
+    root = binaryTree.buildBalancedTree(listForTree)
+    #root = binaryTree.buildBalancedTree(listForTree, nodeClass=binaryTree.slottedBinaryTree)   # compact nodes
 else:
     print "Generate an unbalanced tree with", 
-    root = binaryTree.buildUnbalancedTree(listForTree[:], rootValue)
+    root = binaryTree.buildUnbalancedTree(listForTree, rootValue)
+    #root = binaryTree.buildUnbalancedTree(listForTree, rootValue, binaryTree.avlTree)   # self-balancing (AVL) tree
 if not root:
     print "Error: tree not built",
     raw_input("Press return key to continue: ")
@@ -171,12 +182,19 @@ else:
 
 # Instantiate the visualizeTree object
 vT = visualizeTree.visualizeTree(fileDir)
+vT.setLayoutCache()   # compute the tree layout once, only node colors change during the search
+#vT.setLayoutEngine("native") # compute the tree layout in python, in place of GraphViz's dot layout
+#vT.setRenderBackend("pillow") # draw frames in python, in place of rendering each frame with GraphViz
+#vT.setFrameStore(512*1024*1024) # hold frames in memory up to 512 MB, with vT.setWriteImages(False)
+#vT.setFrameManifest() # write each distinct png image once, see writeFrameManifest() below
+#vT.setRenderJobs(8, 50) # render png images using 8 GraphViz processes at once, 50 frames per process
+#vT.setVideoEncoder("movie.mp4") # encode video during the search, in place of png2mpg4.bat
+#vT.setRenderCache(fileDir + "renderCache") # reuse png images rendered by an earlier run, up to 256 MB of images
+#vT.setSearchLog() # record the search as events, see vT.searchLog.save() below
 
 # Draw the initial binary search tree.
 vT.searchTree(root, visualizeTree.sketchTree)
-vT.setVidFrames(3)
-vT.updateGraph()
-vT.appendVisualizeList()
+vT.showFrame(3)
 
 # Animate a search to find a node in the tree.
 if searchName:
@@ -184,8 +202,15 @@ if searchName:
     vT.searchTree(root, searchNameFcn[searchName], findValue)
 
 # extend the final segment of video for 3 more frames (or 3 seconds in video, based on FFmpeg settings)
-vT.setVidFrames(3)
-vT.updateGraph()
+vT.holdFrame(3)
+#vT.searchLog.save(fileDir + "search.json") # save the search as events, see visualizeTree.replaySearch() to render it again
+if vT.useFrameManifest:
+    # ffmpeg concat file and JSON timeline, in place of the numbered png image sequence
+    vT.writeFrameManifest()
+vT.flushGraph()   # wait for every png image to be written
+if vT.renderCache:
+    print "Render cache:", vT.renderCache.getStats()
+vT.finishVideo()
 
 
 ##################################################################
@@ -199,3 +224,4 @@ sShow = slideShow.slideShow(rootTk)
 sShow.setImageScaling(1280, 720)
 sShow.playSlides(playList, mainTitle, "Quit", True)
 rootTk.destroy()
+vT.visualizeList.close()   # delete any frames spilled to disk by the frame store
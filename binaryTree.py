@@ -17,6 +17,11 @@ File: binaryTree.py
 
 Create a binary search tree
 
+    binaryTree nodes each have an instance dictionary, so any other attribute may be added to a node.
+    slottedBinaryTree nodes have the same methods, and hold only value and links, using less memory per node.
+    avlTree nodes keep the tree balanced (AVL): insert() and delete() rotate nodes so every node's
+        branches differ in height by at most one, whatever order keys are inserted in.
+
 Public methods to interconnect nodes:
     setLeftBranch()
     setRightBranch()
@@ -28,17 +33,37 @@ Public methods to interconnect nodes:
 
 Public methods to operate on nodes:    
     insert()            - insert a node
+    insert_many()       - insert a node for each key of a list, or any iterable, and count duplicate keys
     lookup()            - find a node
     delete()            - delete a node
     children_count()    - return number of children associated with a node
     print_tree()        - print a sorted list of nodes in the tree
+    update()            - refresh information a node keeps about its branches: subtree size and height
+
+Public methods for ordered queries, in time proportional to the tree height:
+    size()              - return the number of nodes in the tree
+    height()            - return the number of nodes on the longest path down from the root
+    rank()              - return the number of keys smaller than a value
+    select()            - return the node with the k-th smallest key
+    count_range()       - return the number of keys from lo up to hi
+
+Public generators of tree content, lazy and iterative (memory proportional to the tree height):
+    iter_inorder()      - generate each key (or node) in ascending order
+    iter_reverse()      - generate each key (or node) in descending order
+    iter_from()         - generate each key (or node) in ascending order, from a key on
+    range()             - generate each key (or node) from lo up to hi
 
 External functions to build a tree:
     manual method           - highlighted example in comments
-    buildBalancedTree()     - generate a balanced tree from a sorted list
+    buildBalancedTree()     - generate a balanced tree from a sorted list, or any sorted iterable of known length
+    buildBalancedTreeFromStream() - generate a tree of least height from a sorted stream of keys
     buildUnbalancedTree()   - generate an unbalanced tree from an unsorted list
 """
 
+import contextlib
+import gc
+import itertools
+
 # History:
 #   Initial project published on 12/11/2013
 #
@@ -60,16 +85,40 @@ External functions to build a tree:
 #       3) Add new binaryTree.delete() method to delete a node, and helper function binaryTree.children_count() to return node's number of children
 #       4) Add new binaryTree.print_tree() method to list node values in sorted order to standard output
 #       5) Improve insert recursive binaryTree.insert() method: a) detect when node already present, b) return inserted node object on success
+#
+#   Rev 4: 10/16/2026
+#       1) Make binaryTree.insert(), lookup() and print_tree() iterative: same results, 
+#            without Python's recursion limit on deep (for example, built from sorted keys) trees.
+#       2) Add class slottedBinaryTree(): same methods as binaryTree, stored in __slots__ without a per node instance dictionary,
+#            selected with the new nodeClass argument of buildBalancedTree() and buildUnbalancedTree().
+#            Methods move to the common base class binaryTreeNode, insert() creates nodes of the same class as the tree.
+#            See arrayTree.py for a tree stored in parallel arrays, for the largest trees.
+#       3) Add class avlTree(): a self-balancing (AVL) tree node, with rotations after insert() and delete(),
+#            and new binaryTreeNode.update() method called when a node's branches change.
+#       4) Make buildBalancedTree() linear time: read the sorted keys with an iterator in place of pop(0), leaving the list unchanged.
+#            Add buildBalancedTreeFromStream() to build from a sorted stream of keys of unknown length.
+#            Both pause the cyclic garbage collector while nodes are allocated, most of the build time for large trees.
+#       5) Add binaryTree.insert_many() to insert keys from any iterable in one pass, counting inserted and duplicate keys,
+#            with a fast path for sorted keys (see insertBelow()). buildUnbalancedTree() uses it, in place of list remove(), and leaves the list unchanged.
+#       6) Keep each node's subtree size and height up to date through insert() and delete(),
+#            add size(), height(), rank(), select() and count_range() methods, in time proportional to tree height.
+#       7) Fix bugs in binaryTree.delete(): a moved child's parent was not updated, and the root node could not be deleted.
+#       8) Add lazy generators iter_inorder(), iter_reverse(), iter_from() and range(), print_tree() uses iter_inorder().
 #       
 
 
-class binaryTree(object):
+class binaryTreeNode(object):
     # Reference: Structure and node naming convention came from edx.org's mitX MOOC course 6.00.1x slides taught by professor Eric Grimson, Fall 2013.
+    # Methods shared by binaryTree and slottedBinaryTree, use one of those two classes to create a tree.
+    __slots__ = ()
+
     def __init__(self, value):
         self.value = value
         self.leftBranch = None
         self.rightBranch = None
         self.parent = None 
+        self.subtreeSize = 1      # integer, number of nodes in the tree below and including this node
+        self.subtreeHeight = 1    # integer, number of nodes on the longest path from this node down to a leaf
         
     def setLeftBranch(self, node):
         self.leftBranch = node
@@ -92,43 +141,123 @@ class binaryTree(object):
     def getParent(self):
         return self.parent
 
+    def update(self):
+        """
+        Refresh information kept in a node about its branches, called when the node's branches change:
+        the size and the height of the tree below and including this node.
+        """
+        size, height = 1, 0
+        for branch in (self.leftBranch, self.rightBranch):
+            if branch is not None:
+                size += branch.subtreeSize
+                if branch.subtreeHeight > height:
+                    height = branch.subtreeHeight
+        self.subtreeSize = size
+        self.subtreeHeight = height + 1
+
+    def updatePath(self, node):
+        """
+        Update node, and every node above it up to the top of the tree, after node's branches changed
+        """
+        while node is not None:
+            node.update()
+            node = node.getParent()
+
     def insert(self, value):
         """
         Insert new node with data key set to value
         Return inserted node object to caller, or None if node not inserted (when node was already present)
         Modified from reference: http://www.laurentluce.com/posts/binary-search-tree-library-in-python/
+        Iterative: descends the tree in a loop, so tree depth is not limited by Python's recursion limit.
         """       
-        if value < self.value:
-            if self.getLeftBranch() is None:
-                self.setLeftBranch(binaryTree(value))
-                self.getLeftBranch().setParent(self)
-                return self.getLeftBranch()
-            else:
-                return self.getLeftBranch().insert(value)
-        elif value > self.value:
-            if self.getRightBranch() is None:
-                self.setRightBranch(binaryTree(value))
-                self.getRightBranch().setParent(self)
-                return self.getRightBranch()
+        node = self.insertBelow(value)[0]
+        if node is not None:
+            self.updatePath(node.getParent())
+        return node
+
+    def insertBelow(self, value, lowerBound=None, upperBound=None):
+        """
+        Insert new node with data key set to value, descending from this node
+        Return (inserted node object, or None when node was already present, 
+                the largest key of the tree below the inserted node's branches, or None when there is none,
+                the smallest key of the tree above the inserted node's branches, or None when there is none)
+        lowerBound and upperBound are the largest and smallest keys of the tree bounding this node's branches, or None
+        The nodes above the inserted node are not updated, see updatePath().
+        """
+        node = self
+        while True:
+            if value < node.value:
+                if node.getLeftBranch() is None:
+                    node.setLeftBranch(self.__class__(value))
+                    node.getLeftBranch().setParent(node)
+                    return (node.getLeftBranch(), lowerBound, node.value)
+                upperBound = node.value
+                node = node.getLeftBranch()
+            elif value > node.value:
+                if node.getRightBranch() is None:
+                    node.setRightBranch(self.__class__(value))
+                    node.getRightBranch().setParent(node)
+                    return (node.getRightBranch(), node.value, upperBound)
+                lowerBound = node.value
+                node = node.getRightBranch()
             else:
-                return self.getRightBranch().insert(value)             
+                return (None, lowerBound, upperBound)
+
+    def insert_many(self, values):
+        """
+        Insert a node for each key of values: any iterable (a list, a tuple, a generator), read once and left unchanged
+        Return (number of nodes inserted, number of duplicate keys not inserted) to caller
+        Sorted fast path: when a key lies between the keys bounding the last node's branches, its place is below
+            the last node, so the search starts there, not from the top.
+            Keys sorted in ascending or descending order are inserted in O(n) steps,
+            in place of O(n^2) steps down an ever longer right or left branch.
+        Nodes above the inserted nodes are updated once, after every key is inserted.
+        """
+        inserted = 0
+        duplicates = 0
+        last = None         # node inserted for the most recent key
+        lastLower = None    # largest key bounding the last node's branches from below, or None when there is none
+        lastUpper = None    # smallest key bounding the last node's branches from above, or None when there is none
+        changed = set()     # nodes above an inserted node, to update
+        top = None          # top node of the tree
+        with pausedGarbageCollection():
+            for value in values:
+                if (last is not None and value != last.value and (lastLower is None or value > lastLower)
+                        and (lastUpper is None or value < lastUpper)):
+                    node, lower, upper = last.insertBelow(value, lastLower, lastUpper)
+                else:
+                    node, lower, upper = self.insertBelow(value)
+                if node is None:
+                    duplicates += 1
+                    continue
+                inserted += 1
+                last, lastLower, lastUpper = node, lower, upper
+                # mark the nodes above, stopping at a node already marked by an earlier key
+                node = node.getParent()
+                while node is not None and node not in changed:
+                    changed.add(node)
+                    if node.getParent() is None:
+                        top = node
+                    node = node.getParent()
+            updateTree(top, changed)
+        return (inserted, duplicates)
 
     def lookup(self, value):
         """
         Lookup node containing data key set to value
         Returns node object to caller, or None if not found
         Modified from reference: http://www.laurentluce.com/posts/binary-search-tree-library-in-python/
+        Iterative: descends the tree in a loop.
         """
-        if value < self.value:
-            if self.getLeftBranch() is None:
-                return None
-            return self.getLeftBranch().lookup(value)
-        elif value > self.value:
-            if self.getRightBranch() is None:
-                return None
-            return self.getRightBranch().lookup(value)
-        else:
-            return self  
+        node = self
+        while node is not None:
+            if value < node.value:
+                node = node.getLeftBranch()
+            elif value > node.value:
+                node = node.getRightBranch()
+            else:
+                return node
+        return None
             
     def delete(self, value):
         """
@@ -136,47 +265,111 @@ class binaryTree(object):
         Returns status text message
         Modified from reference: http://www.laurentluce.com/posts/binary-search-tree-library-in-python/
         """
+        message, changed = self.removeValue(value)
+        self.updatePath(changed)
+        return message
+
+    def removeValue(self, value):
+        """
+        Remove node containing data key set to value, without updating the nodes above it
+        Returns (status text message, lowest node whose branches changed, or None when no node was removed)
+        The top node object of the tree is never removed, so a reference to the root stays valid:
+            when it has a single child, it takes that child's value and branches.
+        """
         # get node containing value and its number of children | or return with node not found message
         node = self.lookup(value)
         if not node:
-            return "Error in delete method: node " + str(value) + " not found"
-        else:
-            children_count = node.children_count(node)
-        if children_count == 0:
-            # if node has no children, just remove it
-            parent = node.getParent()
-            if parent.getLeftBranch() is node:
-                parent.setLeftBranch(None)
-            else:
-                parent.setRightBranch(None)         
-        elif children_count == 1:
-            # if node has 1 child, replace node by its child
-            if node.getLeftBranch():
-                n = node.getLeftBranch()
-            else:
-                n = node.getRightBranch()
-            parent = node.getParent()
-            if parent:
-                if parent.getLeftBranch() is node:
-                    parent.setLeftBranch(n)
-                else:
-                    parent.setRightBranch(n)
-        elif children_count == 2:
-            # if node has 2 children, find its successor
-            parent = node
+            return ("Error in delete method: node " + str(value) + " not found", None)
+        children_count = node.children_count(node)
+        if children_count == 2:
+            # if node has 2 children, replace node value by its successor value, then remove the successor node (it has no left branch)
             successor = node.getRightBranch()
             while successor.getLeftBranch():
-                parent = successor
                 successor = successor.getLeftBranch()
-            # replace node value by its successor value
             node.value = successor.value
-            # fix successor's parent's child
-            if parent.getLeftBranch() == successor:
-                parent.setLeftBranch(successor.getRightBranch()) 
+            node = successor
+        # node has 1 child or no children: replace node by its child
+        child = node.getLeftBranch() or node.getRightBranch()
+        parent = node.getParent()
+        if parent is None:
+            if child is None:
+                return ("Error in delete method: node " + str(value) + " is the only node in the tree", None)
+            node.value = child.value
+            node.setLeftBranch(child.getLeftBranch())
+            node.setRightBranch(child.getRightBranch())
+            for branch in (node.getLeftBranch(), node.getRightBranch()):
+                if branch:
+                    branch.setParent(node)
+            changed = node
+        else:
+            if parent.getLeftBranch() is node:
+                parent.setLeftBranch(child)
             else:
-                parent.setRightBranch(successor.getRightBranch())
+                parent.setRightBranch(child)
+            if child:
+                child.setParent(parent)
+            changed = parent
         childMessageFrag = ("no children", "1 child", "2 children")
-        return "Node " + str(value) + " has " + str(childMessageFrag[children_count]) + " and was successfully deleted"
+        return ("Node " + str(value) + " has " + str(childMessageFrag[children_count]) + " and was successfully deleted", changed)
+
+    def size(self):
+        """
+        Returns the number of nodes in the tree below and including this node
+        """
+        return self.subtreeSize
+
+    def height(self):
+        """
+        Returns the number of nodes on the longest path from this node down to a leaf (1 for a leaf node)
+        """
+        return self.subtreeHeight
+
+    def rank(self, value):
+        """
+        Returns the number of keys smaller than value in the tree below and including this node,
+            so rank(value) is the position of value in sorted order, counting from 0, when value is present
+        Descends the tree once: time proportional to the tree height.
+        """
+        count = 0
+        node = self
+        while node is not None:
+            if value < node.value:
+                node = node.getLeftBranch()
+            elif value > node.value:
+                count += nodeSize(node.getLeftBranch()) + 1
+                node = node.getRightBranch()
+            else:
+                return count + nodeSize(node.getLeftBranch())
+        return count
+
+    def select(self, k):
+        """
+        Returns the node with the k-th smallest key, counting from 0, in the tree below and including this node,
+            or None when k is out of range. select(rank(value)) is the node containing value.
+        Descends the tree once: time proportional to the tree height.
+        """
+        if k < 0:
+            return None
+        node = self
+        while node is not None:
+            leftSize = nodeSize(node.getLeftBranch())
+            if k < leftSize:
+                node = node.getLeftBranch()
+            elif k > leftSize:
+                k -= leftSize + 1
+                node = node.getRightBranch()
+            else:
+                return node
+        return None
+
+    def count_range(self, lo, hi):
+        """
+        Returns the number of keys from lo up to, but not including, hi (lo <= key < hi), 
+            in the tree below and including this node
+        """
+        if not lo < hi:
+            return 0
+        return self.rank(hi) - self.rank(lo)
             
     def children_count(self, node):
         """
@@ -194,17 +387,211 @@ class binaryTree(object):
     def print_tree(self):
         """
         Print tree content inorder
+        Iterative: walks the tree with an explicit stack of at most tree height nodes.
         """
-        if self.getLeftBranch():
-            self.getLeftBranch().print_tree()
-        print self.getValue(),
-        if self.getRightBranch():
-            self.getRightBranch().print_tree()
+        for value in self.iter_inorder():
+            print value,
+
+    def iter_inorder(self, nodes=False):
+        """
+        Generate tree content inorder: each key in ascending order, or each node object when nodes is True
+        Lazy and iterative: holds an explicit stack of at most tree height nodes, and may be stopped at any time.
+        The tree should not be changed (insert, delete) until the generator is done.
+        """
+        stack = []
+        node = self
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.getLeftBranch()
+            else:
+                node = stack.pop()
+                yield node if nodes else node.value
+                node = node.getRightBranch()
+
+    def iter_reverse(self, nodes=False):
+        """
+        Generate tree content in reverse order: each key in descending order, or each node object when nodes is True
+        Lazy and iterative, as iter_inorder().
+        """
+        stack = []
+        node = self
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.getRightBranch()
+            else:
+                node = stack.pop()
+                yield node if nodes else node.value
+                node = node.getLeftBranch()
+
+    def iter_from(self, key, nodes=False):
+        """
+        Generate tree content inorder, starting from the smallest key equal to or larger than key
+        Lazy and iterative, as iter_inorder(): the first key is found in time proportional to the tree height.
+        """
+        # stack the path down to the first key: nodes equal to or larger than key, each one inorder after the nodes above it 
+        stack = []
+        node = self
+        while node:
+            if node.value < key:
+                node = node.getRightBranch()
+            else:
+                stack.append(node)
+                node = node.getLeftBranch()
+        while stack:
+            node = stack.pop()
+            yield node if nodes else node.value
+            node = node.getRightBranch()
+            while node:
+                stack.append(node)
+                node = node.getLeftBranch()
+
+    def range(self, lo, hi, nodes=False):
+        """
+        Generate the keys from lo up to, but not including, hi (lo <= key < hi) in ascending order,
+            or each node object when nodes is True, the same keys counted by count_range()
+        Lazy and iterative, as iter_inorder().
+        """
+        for node in self.iter_from(lo, True):
+            if not node.value < hi:
+                return
+            yield node if nodes else node.value
      
     def __str__(self):
         return str(self.value)
 
 
+class binaryTree(binaryTreeNode):
+    # A tree node with an instance dictionary: any other attribute may be added to a node.
+    pass
+
+
+class slottedBinaryTree(binaryTreeNode):
+    # A compact tree node: value, links, and subtree size and height are held in slots, no instance dictionary is created per node.
+    __slots__ = ('value', 'leftBranch', 'rightBranch', 'parent', 'subtreeSize', 'subtreeHeight')
+
+
+class avlTree(binaryTreeNode):
+    # A self-balancing (AVL) tree node: after insert() and delete(), the heights of each node's two branches differ by at most one,
+    #    so lookup() and ordered searches take O(log n) steps, even for keys inserted in sorted order.
+    #    A rotation exchanges node values, so the root node object stays the root of the tree,
+    #    and the node holding a value may change: use lookup() to find a value's node after an insert() or delete().
+    # Reference: G. Adelson-Velsky and E. Landis, "An algorithm for the organization of information", 1962.
+    __slots__ = ('value', 'leftBranch', 'rightBranch', 'parent', 'subtreeSize', 'subtreeHeight')
+
+    def insert(self, value, onRotate=None):
+        """
+        Insert new node with data key set to value, then rebalance the tree
+        Return inserted node object to caller, or None if node not inserted (when node was already present)
+        onRotate is an optional function called with the top node of each rotation, after the rotation,
+            for example to draw each step (see visualizeTree.drawRotation())
+        """
+        node = self.insertBelow(value)[0]
+        if node is None:
+            return None
+        self.rebalance(node.getParent(), onRotate)
+        return self.lookup(value)
+
+    def insert_many(self, values, onRotate=None):
+        """
+        Insert a node for each key of values: any iterable, read once and left unchanged, rebalancing after each key
+        Return (number of nodes inserted, number of duplicate keys not inserted) to caller
+        Every key is inserted from this node: rotations move values between nodes, so there is no sorted fast path,
+            and none is needed, the tree stays balanced.
+        """
+        inserted = 0
+        duplicates = 0
+        with pausedGarbageCollection():
+            for value in values:
+                if self.insert(value, onRotate) is None:
+                    duplicates += 1
+                else:
+                    inserted += 1
+        return (inserted, duplicates)
+
+    def delete(self, value, onRotate=None):
+        """
+        Delete node containing data key set to value, then rebalance the tree
+        Returns status text message
+        """
+        message, changed = self.removeValue(value)
+        self.rebalance(changed, onRotate)
+        return message
+
+    def rebalance(self, node, onRotate=None):
+        # Update heights from node up to the root, rotating any node whose branch heights differ by more than one
+        while node is not None:
+            node.update()
+            balance = nodeHeight(node.leftBranch) - nodeHeight(node.rightBranch)
+            if balance > 1:
+                if nodeHeight(node.leftBranch.leftBranch) < nodeHeight(node.leftBranch.rightBranch):
+                    # left-right case: first rotate the left branch
+                    node.leftBranch.rotateLeft()
+                    if onRotate:
+                        onRotate(node.leftBranch)
+                node.rotateRight()
+                if onRotate:
+                    onRotate(node)
+            elif balance < -1:
+                if nodeHeight(node.rightBranch.rightBranch) < nodeHeight(node.rightBranch.leftBranch):
+                    # right-left case: first rotate the right branch
+                    node.rightBranch.rotateRight()
+                    if onRotate:
+                        onRotate(node.rightBranch)
+                node.rotateLeft()
+                if onRotate:
+                    onRotate(node)
+            node = node.parent
+
+    def rotateRight(self):
+        # Rotate right: the left branch's value moves up into this node, this node's value moves down to the right
+        #    Node objects keep their place in the tree, so parent pointers above this node never change.
+        top = self.leftBranch
+        self.value, top.value = top.value, self.value
+        left, middle, right = top.leftBranch, top.rightBranch, self.rightBranch
+        self.leftBranch = left
+        if left:
+            left.parent = self
+        top.leftBranch = middle
+        top.rightBranch = right
+        if right:
+            right.parent = top
+        self.rightBranch = top
+        top.update()
+        self.update()
+
+    def rotateLeft(self):
+        # Rotate left: the right branch's value moves up into this node, this node's value moves down to the left
+        top = self.rightBranch
+        self.value, top.value = top.value, self.value
+        left, middle, right = self.leftBranch, top.leftBranch, top.rightBranch
+        self.rightBranch = right
+        if right:
+            right.parent = self
+        top.rightBranch = middle
+        top.leftBranch = left
+        if left:
+            left.parent = top
+        self.leftBranch = top
+        top.update()
+        self.update()
+
+
+def nodeHeight(node):
+    # Return the height kept by a node, or 0 for a missing node
+    if node is None:
+        return 0
+    return node.subtreeHeight
+
+
+def nodeSize(node):
+    # Return the size kept by a node, or 0 for a missing node
+    if node is None:
+        return 0
+    return node.subtreeSize
+
+
 """
 A Manual Method to Instantiate a Tree
 -------------------------------------
@@ -232,6 +619,7 @@ n6.setRightBranch(n7)
 n7.setParent(n6)
 n4.setLeftBranch(n3)
 n3.setParent(n4)
+updateTree(n5)   # set each node's subtree size and height
 
 # define sketch tree and animate search parameters
 root = n5
@@ -243,26 +631,26 @@ listForTree = None
 # Helper functions to instantiate a tree from a list
 # --------------------------------------------------
 
-def buildBalancedTree(sortedList, start, end):
+def buildBalancedTree(sortedList, start=0, end=None, nodeClass=binaryTree):
     """
-    Build a balanced binary search tree from a sorted linked list.
+    Build a balanced binary search tree from a sorted list, in linear time.
 
     This function uses class binaryTree, with methods:
         'getLeftBranch()', 'getRightBranch()' and optionally setParent().
 
     Input:
-        sortedList: sorted list, any data structure with 'pop(0)' method,
-            which removes and returns the leftmost element of the list. The
-            easiest thing to do is to use a list for the sorted
-            list.
-        start: int, start index, on initial call set to 0
-        end: int, on initial call should be set to len(sortedList)
+        sortedList: sorted list, or any sorted iterable (a tuple, an array, a generator, a file of keys),
+            read once from front to back. The easiest thing to do is to use a list for the sorted list.
+        start: int, start index, default 0
+        end: int, end index, default len(sortedList) (required when sortedList has no len())
+        nodeClass: class of the tree nodes, binaryTree, slottedBinaryTree or avlTree
     Output: 
-        root node of type binaryTree if the supplied list has 2 or more values,
+        root node of type nodeClass if the supplied list has 1 or more values,
             or None.
             
     Note:
-        The sortedList list is destroyed during the process.
+        The sortedList list is left unchanged: keys are read with an iterator, in place of pop(0).
+        See buildBalancedTreeFromStream() when the number of keys is not known in advance.
         
     References:
         The original python implementation used a sorted "linked" list found here:
@@ -270,39 +658,136 @@ def buildBalancedTree(sortedList, start, end):
         Based on an original solution in C found here: 
             http://leetcode.com/2010/11/convert-sorted-list-to-balanced-binary.html
     """
+    if end == None:
+        end = len(sortedList)
     if start >= end:
         return None
-    middle = (start + end) // 2
-    node = buildBalancedTree(sortedList, start, middle)
-    root = binaryTree(sortedList.pop(0))
+    with pausedGarbageCollection():
+        return buildBalancedSubtree(itertools.islice(sortedList, start, end), end - start, nodeClass)
+
+
+def buildBalancedSubtree(keys, count, nodeClass=binaryTree):
+    # Build a balanced tree from the next count keys of an iterator, the middle key at the root,
+    #    in order: left branch first, so each key is read exactly once. Recursion depth is the tree height.
+    if count <= 0:
+        return None
+    node = buildBalancedSubtree(keys, count // 2, nodeClass)
+    root = nodeClass(next(keys))
     root.setLeftBranch(node)
     if root.getLeftBranch():
         root.getLeftBranch().setParent(root)    
-    root.setRightBranch(buildBalancedTree(sortedList, middle+1, end))
+    root.setRightBranch(buildBalancedSubtree(keys, count - count // 2 - 1, nodeClass))
     if root.getRightBranch():
         root.getRightBranch().setParent(root)      
+    root.update()
     return root      
 
 
-def buildUnbalancedTree(unsortedList, rootValue):
+def buildBalancedTreeFromStream(sortedKeys, nodeClass=binaryTree):
+    """
+    Build a binary search tree of least possible height from a sorted stream of keys, in linear time,
+    without knowing the number of keys in advance, and without holding the keys in a list first.
+
+    Input:
+        sortedKeys: any sorted iterable of unique keys (example: a generator, or the lines of a sorted file),
+        nodeClass: class of the tree nodes, binaryTree or slottedBinaryTree
+    Output:
+        root node of type nodeClass, or None for an empty stream.
+
+    Note:
+        The i-th key (counting from 1) is placed at level t above the leaves, where 2**t is the largest power of 2 dividing i.
+        Each node takes the latest node of the level below as its left branch, and becomes the right branch of the latest node
+            of the level above when that node is waiting for one, so every node is linked as it is read.
+        The tree is perfectly balanced for 2**k - 1 keys. Otherwise the right-most branches are shorter, 
+            and branch heights may differ by more than one, so use buildBalancedTree() for avlTree nodes.
+    """
+    with pausedGarbageCollection():
+        return buildStreamTree(sortedKeys, nodeClass)
+
+
+def buildStreamTree(sortedKeys, nodeClass=binaryTree):
+    # Build the tree for buildBalancedTreeFromStream()
+    latest = []     # latest node read at each level
+    waiting = []    # True when the latest node at a level is waiting to become the left branch of a later node
+    for i, key in enumerate(sortedKeys, 1):
+        level = 0
+        while not i & (1 << level):
+            level += 1
+        node = nodeClass(key)
+        if level > 0:
+            node.setLeftBranch(latest[level-1])
+            latest[level-1].setParent(node)
+            waiting[level-1] = False
+        if level == len(latest):
+            latest.append(None)
+            waiting.append(False)
+        latest[level] = node
+        # levels alternate: left branch of the next node above, then right branch of the last node above
+        waiting[level] = (i >> level) & 3 == 1
+        if not waiting[level]:
+            latest[level+1].setRightBranch(node)
+            node.setParent(latest[level+1])
+    # link nodes still waiting for a parent (keys past the last full subtree): down the right-most branch, top level first
+    root = None
+    for level in range(len(latest)-1, -1, -1):
+        if waiting[level]:
+            if root == None:
+                root = latest[level]
+            else:
+                parent = root
+                while parent.getRightBranch():
+                    parent = parent.getRightBranch()
+                parent.setRightBranch(latest[level])
+                latest[level].setParent(parent)
+    updateTree(root)
+    return root
+
+
+@contextlib.contextmanager
+def pausedGarbageCollection():
+    # Pause python's cyclic garbage collector while a tree is built: each node and its parent form a reference cycle,
+    #    so collections triggered by allocating nodes scan the growing tree again and again, with nothing to free.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def updateTree(root, nodes=None):
+    # Call update() on every node of a tree, branches before their parent node (post-order), without recursion
+    #    nodes, when given, is a set of nodes to update, holding every node above each of its nodes: others are left as they are.
+    #    Call updateTree(root) after linking nodes by hand, with setLeftBranch() and setRightBranch().
+    stack = [root] if root else []
+    order = []
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        for branch in (node.getLeftBranch(), node.getRightBranch()):
+            if branch and (nodes is None or branch in nodes):
+                stack.append(branch)
+    for node in reversed(order):
+        node.update()
+
+
+def buildUnbalancedTree(unsortedList, rootValue, nodeClass=binaryTree):
     """
     Build an unbalanced binary search tree
     Input: An unsorted list of key values to generate a tree, 
            The root key value, a member of the unsortedList.         
+           The class of the tree nodes, binaryTree, slottedBinaryTree or avlTree (kept balanced).
     Output: rootNode when rootValue was found in unsortedList, otherwise return None.           
                          
     Notes:
-        The unsortedList list is destroyed during the process.
+        The unsortedList list is left unchanged.
         The nodes will be inserted into the tree using unsortedList list from left to right,
-            Uses the binaryTree.insert() method.
+            Uses the binaryTree.insert_many() method, the root key value is skipped as a duplicate.
     """
     if rootValue not in unsortedList:
         return None
-    rootIndex = unsortedList.index(rootValue)
-    rootNode = binaryTree(unsortedList[rootIndex])
-    unsortedList.remove(unsortedList[rootIndex])
-    while len(unsortedList):           
-        rootNode.insert(unsortedList[0])
-        unsortedList.remove(unsortedList[0])
+    rootNode = nodeClass(rootValue)
+    rootNode.insert_many(unsortedList)
     return rootNode                       
    
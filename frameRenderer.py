@@ -0,0 +1,213 @@
+"""
+File: frameRenderer.py
+
+ Support Module for: Animate a Binary Search Tree using Python, pyDot, GraphViz
+
+ Project home: http://www.embeddedcomponents.com/blogs/2013/12/visualizing-software-tree-structures/
+
+ Developed by Ron Fredericks, Video Technologist, at LectureMaker LLC, http://www.LectureMaker.com
+    MIT License, Copyright (c) 2013, Ron Fredericks
+    Free to use following these terms: http://opensource.org/licenses/MIT
+
+ Revision 4: 10/16/2026
+
+#############################################################
+# Class frameRenderer
+#############################################################
+
+Render DOT graph snapshots into image files outside of the search loop.
+
+    Each snapshot is the DOT text of a frame (example: visualizeTree's graph.to_string()),
+    captured together with the image file name it should be written to, so file numbering
+    is fixed when the frame is captured, not when it is rendered.
+
+    Frames may be grouped into batches: every frame of a batch is sent to one GraphViz process
+    as a stream of graphs, and the png stream it returns is split back into one image per frame.
+    Most of the cost of a small frame is GraphViz process startup, not drawing.
+
+Public methods:
+    frameRenderer(jobs, batchSize) - instantiate a renderer running up to "jobs" GraphViz processes at once,
+                                     each rendering up to "batchSize" frames
+    render()                       - queue a DOT snapshot to be rendered into an image file
+    create()                       - queue a DOT snapshot to be rendered into memory, return a renderedImage
+    flush()                        - wait until every queued image file has been written
+    close()                        - flush, then stop the worker pool
+"""
+
+import subprocess
+import struct
+from multiprocessing.pool import ThreadPool
+
+# History:
+#   Rev 4: 10/16/2026
+#       1) Create (this) frameRenderer.py module to render frames in parallel.
+#            Each worker thread waits on its own GraphViz process, so "jobs" dot processes run at the same time
+#            without having to pickle frames, or guard the main program for multiprocessing on Windows.
+#       2) Add batches: send up to batchSize frames to a single GraphViz process, then split the png output per frame.
+#       3) Add createDot() to render DOT text into memory, in place of pydot's create().
+#       4) Add create() and class renderedImage: queue a frame rendered into memory (example: for a video encoder),
+#            read with renderedImage.get() once flush() has returned.
+
+
+class frameRenderer(object):
+    def __init__(self, jobs=4, batchSize=1):
+        self.jobs = jobs            # integer, maximum number of GraphViz processes running at once
+        self.batchSize = batchSize  # integer, maximum number of frames rendered by one GraphViz process
+        self.pool = None            # worker pool, created on the first call to render()
+        self.pending = []           # results of queued batches, in the order they were captured
+        self.batch = []             # (DOT text, file name or None) of each frame in the batch being collected
+        self.batchImages = []       # renderedImage of each frame in the batch being collected
+        self.batchOptions = None    # (prog, fileFormat) shared by every frame in the batch being collected
+
+    def render(self, dotData, fileName, prog=('dot',), fileFormat='png'):
+        # Queue a DOT snapshot to be rendered into fileName
+        # Input:
+        #     dotData is the DOT text of the frame,
+        #     fileName is the full image file name to write,
+        #     prog is the GraphViz program and its arguments (example: ('neato', '-n2') for a cached layout),
+        #     fileFormat is the GraphViz output format
+        if isinstance(prog, basestring):
+            prog = (prog,)
+        options = (tuple(prog), fileFormat)
+        if self.batch and options != self.batchOptions:
+            # a batch is rendered by a single GraphViz command line
+            self.submitBatch()
+        self.batchOptions = options
+        image = renderedImage(fileName)
+        self.batch.append((dotData, fileName))
+        self.batchImages.append(image)
+        if len(self.batch) >= self.batchSize:
+            self.submitBatch()
+        return image
+
+    def create(self, dotData, prog=('dot',), fileFormat='png'):
+        # Queue a DOT snapshot to be rendered into memory, in place of a file
+        # Output: renderedImage, its image data is read with get() once flush() has returned
+        return self.render(dotData, None, prog, fileFormat)
+            
+    def submitBatch(self):
+        # Hand the batch being collected to the worker pool
+        if not self.batch:
+            return
+        if self.pool == None:
+            self.pool = ThreadPool(self.jobs)
+        prog, fileFormat = self.batchOptions
+        result = self.pool.apply_async(renderDotBatch, (self.batch, prog, fileFormat))
+        for index, image in enumerate(self.batchImages):
+            image.result, image.index = result, index
+        self.pending.append(result)
+        self.batch = []
+        self.batchImages = []
+
+    def flush(self):
+        # Wait until every queued image file has been written,
+        #    an error from any GraphViz process is raised here, in the order the frames were captured.
+        self.submitBatch()
+        pending, self.pending = self.pending, []
+        for result in pending:
+            result.get()
+
+    def close(self):
+        # Flush, then stop the worker pool
+        self.flush()
+        if self.pool != None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+
+class renderedImage(object):
+    # A frame queued by frameRenderer.render() or create(): get() returns its image data once rendered,
+    #    read from its image file, or kept in memory when it has no file name.
+    __slots__ = ('fileName', 'result', 'index')
+
+    def __init__(self, fileName=None):
+        self.fileName = fileName    # string, image file written, or None for a frame rendered into memory
+        self.result = None          # result of the batch rendering the frame, set when the batch is submitted
+        self.index = None           # integer, position of the frame in its batch
+
+    def get(self):
+        # Wait for the frame to be rendered, and return its image data
+        if self.result != None:
+            self.result.get()
+        if self.fileName == None:
+            return self.result.get()[self.index]
+        with open(self.fileName, 'rb') as f:
+            return f.read()
+
+
+def renderDot(dotData, fileName, prog=('dot',), fileFormat='png'):
+    # Render DOT text into an image file using a GraphViz program
+    # Output: fileName, or raise RuntimeError with GraphViz error message
+    if isinstance(prog, basestring):
+        prog = (prog,)
+    process = subprocess.Popen(list(prog) + ['-T' + fileFormat, '-o', fileName],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = process.communicate(dotData)
+    if process.returncode != 0:
+        raise RuntimeError("Error: " + prog[0] + " failed to render " + fileName + ": " + stderr)
+    return fileName
+
+
+def createDot(dotData, prog=('dot',), fileFormat='png'):
+    # Render DOT text using a GraphViz program, without writing a file
+    # Output: GraphViz output (example: png image data), or raise RuntimeError with GraphViz error message
+    if isinstance(prog, basestring):
+        prog = (prog,)
+    process = subprocess.Popen(list(prog) + ['-T' + fileFormat],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = process.communicate(dotData)
+    if process.returncode != 0:
+        raise RuntimeError("Error: " + prog[0] + " failed to render: " + stderr)
+    return stdout
+
+
+def renderDotBatch(batch, prog=('dot',), fileFormat='png'):
+    # Render a batch of DOT texts using one GraphViz process, and write one image file per DOT text
+    # Input: batch is a list of (DOT text, file name) tuples, a file name of None keeps the image in memory
+    # Output: list of file names, or image data for frames without a file name, 
+    #    or raise RuntimeError with GraphViz error message
+    if len(batch) == 1:
+        if batch[0][1] == None:
+            return [createDot(batch[0][0], prog, fileFormat)]
+        return [renderDot(batch[0][0], batch[0][1], prog, fileFormat)]
+    assert fileFormat == 'png', "Error: only png images can be split from a GraphViz output stream"
+    process = subprocess.Popen(list(prog) + ['-T' + fileFormat],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = process.communicate('\n'.join([dotData for dotData, fileName in batch]))
+    if process.returncode != 0:
+        raise RuntimeError("Error: " + prog[0] + " failed to render a batch of " + str(len(batch)) + " frames: " + stderr)
+    images = splitPng(stdout)
+    if len(images) != len(batch):
+        raise RuntimeError("Error: " + prog[0] + " returned " + str(len(images)) + " images for a batch of " + str(len(batch)))
+    results = []
+    for (dotData, fileName), image in zip(batch, images):
+        if fileName == None:
+            results.append(image)
+            continue
+        with open(fileName, 'wb') as f:
+            f.write(image)
+        results.append(fileName)
+    return results
+
+
+PNG_SIGNATURE = '\x89PNG\r\n\x1a\n'
+
+def splitPng(data):
+    # Split a stream of concatenated png images into a list of png images
+    #    A png image is the png signature followed by chunks (length, type, data, crc), ending with an IEND chunk.
+    images = []
+    start = 0
+    while start < len(data):
+        if data[start:start+8] != PNG_SIGNATURE:
+            raise RuntimeError("Error: png signature not found at byte " + str(start) + " of GraphViz output")
+        end = start + 8
+        chunkType = None
+        while chunkType != 'IEND':
+            if end + 8 > len(data):
+                raise RuntimeError("Error: png image truncated at byte " + str(end) + " of GraphViz output")
+            length, chunkType = struct.unpack('>I4s', data[end:end+8])
+            end += length + 12
+        images.append(data[start:end])
+        start = end
+    return images
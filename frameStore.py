@@ -0,0 +1,141 @@
+"""
+File: frameStore.py
+
+ Support Module for: Animate a Binary Search Tree using Python, and the python image library
+
+ Project home: http://www.embeddedcomponents.com/blogs/2013/12/visualizing-software-tree-structures/
+
+ Developed by Ron Fredericks, Video Technologist, at LectureMaker LLC, http://www.LectureMaker.com
+    MIT License, Copyright (c) 2013, Ron Fredericks
+    Free to use following these terms: http://opensource.org/licenses/MIT
+
+ Revision 4: 10/16/2026
+
+#############################################################
+# Class frameStore
+#############################################################
+
+Hold the frames of an animation in memory, up to a memory budget, and spill the oldest frames to disk past it.
+
+    A frame is appended as any of:
+        an image file name (kept as is, it is already on disk),
+        png image data (file contents, as returned by GraphViz),
+        an image object (see treeRaster.py).
+    Reading a frame back returns an image file name, or an image object, the two forms accepted by slideShow.playSlides().
+    A frameStore can be used in place of a list of image file names: len(), indexing, iteration and append() all work.
+
+Public methods:
+    frameStore(memoryBudget, spillDir, encoded) - instantiate a store, memoryBudget in bytes or None for no limit
+    append()                                    - add a frame
+    getMemoryUsed()                             - return the number of bytes of frames held in memory
+    close()                                     - delete the image files spilled to disk
+"""
+
+import io
+import os
+import tempfile
+from collections import deque
+
+from frameRenderer import PNG_SIGNATURE
+
+# History:
+#   Rev 4: 10/16/2026
+#       1) Create (this) frameStore.py module to hold visualizeTree's visualizeList frames in memory.
+#       2) Import the python image library only when png image data is read back (see openPng()),
+#            so visualizeTree's png image files path does not require it.
+
+
+class frameStore(object):
+    def __init__(self, memoryBudget=None, spillDir=None, encoded=False):
+        self.memoryBudget = memoryBudget  # integer, bytes of frames to hold in memory, or None for no limit
+        self.spillDir = spillDir          # string, directory for frames spilled to disk, or None for a temporary directory
+        self.encoded = encoded            # boolean, hold image objects as png image data: smaller, but decoded on every read
+        self.frames = []                  # each frame as a (kind, data) tuple, kind is "file", "png" or "image"
+        self.inMemory = deque()           # index of each frame held in memory, oldest first
+        self.memoryUsed = 0               # integer, bytes of frames held in memory
+        self.spilledFiles = []            # image files written by this store, deleted by close()
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.frames)))]
+        kind, data = self.frames[index]
+        if kind == 'png':
+            return openPng(data)
+        return data
+
+    def __iter__(self):
+        for i in range(0, len(self.frames)):
+            yield self[i]
+
+    def append(self, frame):
+        # Add a frame: an image file name, png image data, or an image object
+        # a unicode string is always a file name: png image data is a byte string
+        if isinstance(frame, unicode) or (isinstance(frame, str) and not frame.startswith(PNG_SIGNATURE)):
+            self.frames.append(('file', frame))
+            return
+        if isinstance(frame, str):
+            entry = ('png', frame)
+        elif self.encoded:
+            entry = ('png', encodePng(frame))
+        else:
+            entry = ('image', frame)
+        self.frames.append(entry)
+        self.inMemory.append(len(self.frames) - 1)
+        self.memoryUsed += frameSize(entry)
+        self.spill()
+
+    def spill(self):
+        # Write the oldest frames held in memory to disk, until memory used is within the memory budget
+        #    The newest frame always stays in memory.
+        while self.memoryBudget != None and self.memoryUsed > self.memoryBudget and len(self.inMemory) > 1:
+            index = self.inMemory.popleft()
+            kind, data = self.frames[index]
+            if self.spillDir == None:
+                self.spillDir = tempfile.mkdtemp(prefix='frameStore')
+            fileName = os.path.join(self.spillDir, 'frame%05d.png' % index)
+            if kind == 'png':
+                with open(fileName, 'wb') as f:
+                    f.write(data)
+            else:
+                data.save(fileName, 'PNG')
+            self.spilledFiles.append(fileName)
+            self.frames[index] = ('file', fileName)
+            self.memoryUsed -= frameSize((kind, data))
+
+    def getMemoryUsed(self):
+        # Return the number of bytes of frames held in memory
+        return self.memoryUsed
+
+    def close(self):
+        # Delete the image files spilled to disk, spilled frames can no longer be read
+        for fileName in self.spilledFiles:
+            if os.path.exists(fileName):
+                os.remove(fileName)
+        self.spilledFiles = []
+
+
+def frameSize(entry):
+    # Return the number of bytes used by a frame held in memory
+    kind, data = entry
+    if kind == 'png':
+        return len(data)
+    return data.size[0] * data.size[1] * len(data.getbands())
+
+
+def encodePng(image):
+    # Return an image object as png image data, favoring speed over compression
+    output = io.BytesIO()
+    image.save(output, 'PNG', compress_level=1)
+    return output.getvalue()
+
+
+def openPng(data):
+    # Return png image data as an image object
+    try:
+        from PIL import Image
+    except ImportError:
+        import Image
+    return Image.open(io.BytesIO(data))
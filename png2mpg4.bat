@@ -23,6 +23,11 @@ REM	-vf scale=720:480 is a simple video filter to scale output to a normal size
 REM	-vf scale="'if(gt(a,4/3),1920,-1)':'if(gt(a,4/3),-1,1280)'" is a more advanced video filter to scale output to 1920x1080 (HD)
 REM	-y overides output file without asking
 REM	movie.mp4 is the output file name
+:
+REM When visualizeTree.setFrameManifest() is used, each distinct png image is written once,
+REM      replace the image2 input options with the ffmpeg concat file written by visualizeTree.writeFrameManifest():
+REM	ffmpeg -f concat -i bst_graph.ffconcat -b:v 5000k -vcodec mpeg4 -r 30 -vf scale=... -y movie.mp4
+REM To encode video directly from python, on any platform, see visualizeTree.setVideoEncoder() and videoEncoder.py
 :	
 @echo on
 cd .\vidImages
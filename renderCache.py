@@ -0,0 +1,189 @@
+"""
+File: renderCache.py
+
+ Support Module for: Animate a Binary Search Tree using Python, pyDot, GraphViz
+
+ Project home: http://www.embeddedcomponents.com/blogs/2013/12/visualizing-software-tree-structures/
+
+ Developed by Ron Fredericks, Video Technologist, at LectureMaker LLC, http://www.LectureMaker.com
+    MIT License, Copyright (c) 2013, Ron Fredericks
+    Free to use following these terms: http://opensource.org/licenses/MIT
+
+ Revision 4: 10/16/2026
+
+#############################################################
+# Class renderCache
+#############################################################
+
+Keep the images rendered by GraphViz in a directory, to reuse them when the same frame is rendered again.
+
+    Each image is named by a hash of its DOT text and render options (GraphViz program, arguments and output format),
+    so a frame drawn again, by this run or by a later one, is found whatever search or png image number it is part of:
+    example: the sketch of a tree, and the first frames of a breadth first search, are the same for every key searched.
+    A cached image is hard linked to the png image file it is needed for, or copied when hard links are not supported.
+
+    The cache holds up to maxBytes of images: past it, the least recently used images are deleted.
+    Use is tracked by each image file's modification time, so the order is kept from one run to the next.
+    Several processes may share a cache directory (see batchAnimation.py), each image file is written whole, then renamed.
+
+Public methods:
+    renderCache(cacheDir, maxBytes) - instantiate a cache in cacheDir, holding up to maxBytes of images
+    key()                           - return the cache key of a frame: its DOT text and render options
+    read()                          - return a cached image's data, or None
+    link()                          - hard link (or copy) a cached image to a file name, return True if it was cached
+    store()                         - add an image to the cache, as image data
+    storeFile()                     - add an image to the cache, from an image file
+    getStats()                      - return the cache hit and miss counts, and the bytes held
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+
+# History:
+#   Rev 4: 10/16/2026
+#       1) Create (this) renderCache.py module: a content addressed, size limited cache of GraphViz images.
+
+
+class renderCache(object):
+    def __init__(self, cacheDir, maxBytes=256*1024*1024):
+        self.cacheDir = cacheDir    # string, directory holding the cached images, created when missing
+        self.maxBytes = maxBytes    # integer, bytes of images to hold, the least recently used are deleted past it
+        self.hits = 0               # integer, frames found in the cache
+        self.misses = 0             # integer, frames not found in the cache, rendered by GraphViz
+        self.entries = OrderedDict()  # each cached image's key (key) with its size in bytes (value), least recently used first
+        self.bytesUsed = 0          # integer, bytes of images held
+        if not os.path.isdir(cacheDir):
+            try:
+                os.makedirs(cacheDir)
+            except OSError:
+                pass   # made by another process
+        self.scan()
+
+    def scan(self):
+        # Read the images already cached, oldest modification time first
+        entries = []
+        for fileName in os.listdir(self.cacheDir):
+            if fileName.endswith('.tmp'):
+                continue
+            try:
+                status = os.stat(os.path.join(self.cacheDir, fileName))
+            except OSError:
+                continue
+            entries.append((status.st_mtime, fileName, status.st_size))
+        entries.sort()
+        self.entries = OrderedDict([(key, size) for mtime, key, size in entries])
+        self.bytesUsed = sum(self.entries.values())
+
+    def key(self, dotData, prog=('dot',), fileFormat='png'):
+        # Return the cache key of a frame: a hash of its render options and DOT text, with the output format as extension
+        if isinstance(prog, basestring):
+            prog = (prog,)
+        digest = hashlib.sha1(' '.join(prog) + ' -T' + fileFormat + '\n')
+        digest.update(dotData)
+        return digest.hexdigest() + '.' + fileFormat
+
+    def cacheFileName(self, key):
+        return os.path.join(self.cacheDir, key)
+
+    def touch(self, key):
+        # Mark a cached image as the most recently used, in memory and by its modification time
+        #    Output: True, or False if the image file was deleted (example: by another process)
+        try:
+            os.utime(self.cacheFileName(key), None)
+        except OSError:
+            self.forget(key)
+            return False
+        if key in self.entries:
+            self.entries[key] = self.entries.pop(key)
+        else:
+            # cached by another process
+            self.entries[key] = os.path.getsize(self.cacheFileName(key))
+            self.bytesUsed += self.entries[key]
+        return True
+
+    def forget(self, key):
+        if key in self.entries:
+            self.bytesUsed -= self.entries.pop(key)
+
+    def read(self, key):
+        # Return a cached image's data, or None (counted as a miss)
+        if self.touch(key):
+            try:
+                with open(self.cacheFileName(key), 'rb') as f:
+                    data = f.read()
+                self.hits += 1
+                return data
+            except IOError:
+                self.forget(key)
+        self.misses += 1
+        return None
+
+    def link(self, key, fileName):
+        # Hard link a cached image to fileName, or copy it when hard links are not supported,
+        #    replacing any file of that name.
+        # Output: True, or False if the image is not cached (counted as a miss)
+        if self.touch(key):
+            if os.path.exists(fileName):
+                os.remove(fileName)
+            try:
+                os.link(self.cacheFileName(key), fileName)
+            except (AttributeError, OSError):
+                # no os.link() on Windows with python 2, or a file system without hard links
+                try:
+                    shutil.copyfile(self.cacheFileName(key), fileName)
+                except IOError:
+                    self.forget(key)
+                    self.misses += 1
+                    return False
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def store(self, key, data):
+        # Add an image to the cache, as image data
+        if key in self.entries or len(data) > self.maxBytes:
+            return
+        handle, tempName = tempfile.mkstemp(suffix='.tmp', dir=self.cacheDir)
+        with os.fdopen(handle, 'wb') as f:
+            f.write(data)
+        self.add(key, tempName, len(data))
+
+    def storeFile(self, key, fileName):
+        # Add an image to the cache, copied from an image file (not linked: the image file may be written again)
+        if key in self.entries or not os.path.exists(fileName) or os.path.getsize(fileName) > self.maxBytes:
+            return
+        handle, tempName = tempfile.mkstemp(suffix='.tmp', dir=self.cacheDir)
+        os.close(handle)
+        shutil.copyfile(fileName, tempName)
+        self.add(key, tempName, os.path.getsize(tempName))
+
+    def add(self, key, tempName, size):
+        # Rename a whole image file written into the cache directory to its key, then evict past maxBytes
+        cacheFileName = self.cacheFileName(key)
+        if os.path.exists(cacheFileName):
+            # another process cached it first (rename cannot replace a file on Windows)
+            os.remove(tempName)
+            self.touch(key)
+            return
+        os.rename(tempName, cacheFileName)
+        self.entries[key] = size
+        self.bytesUsed += size
+        self.evict()
+
+    def evict(self):
+        # Delete the least recently used images, until bytes held are within maxBytes
+        while self.bytesUsed > self.maxBytes and self.entries:
+            key, size = self.entries.popitem(last=False)
+            self.bytesUsed -= size
+            try:
+                os.remove(self.cacheFileName(key))
+            except OSError:
+                pass   # deleted by another process
+
+    def getStats(self):
+        # Return a dictionary of the hit and miss counts, the number of images, and the bytes held
+        return {'hits': self.hits, 'misses': self.misses, 'images': len(self.entries), 'bytes': self.bytesUsed}
@@ -0,0 +1,191 @@
+"""
+File: searchLog.py
+
+ Support Module for: Animate a Binary Search Tree using Python, pyDot, GraphViz
+
+ Project home: http://www.embeddedcomponents.com/blogs/2013/12/visualizing-software-tree-structures/
+
+ Developed by Ron Fredericks, Video Technologist, at LectureMaker LLC, http://www.LectureMaker.com
+    MIT License, Copyright (c) 2013, Ron Fredericks
+    Free to use following these terms: http://opensource.org/licenses/MIT
+
+ Revision 4: 10/16/2026
+
+#############################################################
+# Class searchLog
+#############################################################
+
+Record an animated search as a list of events, to be rendered again later without searching again.
+
+    Each event is a (kind, node label, video frames) tuple, kind is one of:
+        "frame"     - show the current drawing (example: the full tree before a search)
+        "visit"     - a node is traversed: drawn red, then as a red-grey breadcrumb
+        "found"     - the node searched for is found: drawn green
+        "exhausted" - the search ended without finding its node (no label, no frame)
+        "hold"      - hold the current drawing in the video (example: the end of the video)
+    The tree searched is recorded with the events, by node label, so a log can be replayed on its own:
+        see visualizeTree's replaySearch(), to render a log to png images, video, or the slideShow.
+
+    A log is saved as JSON text, or in a compact binary form (a label table, then fixed size records).
+
+Public methods:
+    searchLog()    - instantiate an empty log
+    setTree()      - record the tree searched, by its root node, starting a new event list when the tree changes
+    append()       - add an event
+    getRoot()      - return a copy of the tree searched, nodes valued by their labels
+    getFrameCount() - return the number of video frames the events are held for
+    save()         - write the log into a JSON or binary file
+
+Public functions:
+    loadSearchLog() - read a log from a JSON or binary file
+"""
+
+import json
+import struct
+
+import binaryTree
+
+# History:
+#   Rev 4: 10/16/2026
+#       1) Create (this) searchLog.py module: record searches as events, replayed by visualizeTree.replaySearch().
+#       2) Add getFrameCount(), used by visualizeTree.replaySearch() and batchAnimation.py.
+#       3) setTree() drops the events of an earlier tree, recording is off in visualizeTree until setSearchLog() is called.
+#       4) Keep labels as byte strings through save() and loadSearchLog(): labels come from str(node).
+
+
+EVENT_KINDS = ('frame', 'visit', 'found', 'exhausted', 'hold')
+BINARY_MAGIC = 'BSTL'
+BINARY_VERSION = 1
+FRAME_WEIGHTS = {'visit': 2}   # png images rendered per event, when not 1: a visit draws the node red, then as a breadcrumb
+
+
+class searchLog(object):
+    def __init__(self):
+        self.root = None    # root node of the tree searched, its shape is read when the log is saved or replayed
+        self.tree = None    # node labels of the tree searched in preorder, None for a missing branch
+        self.events = []    # each event as a (kind, node label or None, video frames) tuple
+
+    def __len__(self):
+        return len(self.events)
+
+    def setTree(self, root):
+        # Record the tree searched: the tree should not change until the log is saved or replayed
+        #    Events recorded against an earlier tree are dropped, they can not be replayed against this one.
+        if root is not self.root:
+            if self.root is not None:
+                self.events = []
+            self.root = root
+            self.tree = None
+
+    def append(self, kind, label=None, frames=1):
+        # Add an event
+        self.events.append((kind, label, frames))
+
+    def getFrameCount(self):
+        # Return the number of video frames the events are held for
+        return sum([frames * FRAME_WEIGHTS.get(kind, 1) for kind, label, frames in self.events])
+
+    def getTree(self):
+        # Return the node labels of the tree searched in preorder, None for a missing branch
+        if self.tree == None and self.root != None:
+            self.tree = []
+            stack = [self.root]
+            while stack:
+                node = stack.pop()
+                if node == None:
+                    self.tree.append(None)
+                    continue
+                self.tree.append(str(node))
+                stack.append(node.getRightBranch())
+                stack.append(node.getLeftBranch())
+        return self.tree or []
+
+    def getRoot(self):
+        # Return a copy of the tree searched, each node valued by its label, or None
+        tree = self.getTree()
+        if not tree or tree[0] == None:
+            return None
+        # each stack entry: a node still missing a branch, and the branch it is missing (left first)
+        root = binaryTree.binaryTree(tree[0])
+        stack = [(root, 'right'), (root, 'left')]
+        for label in tree[1:]:
+            parent, branch = stack.pop()
+            if label == None:
+                continue
+            node = binaryTree.binaryTree(label)
+            node.setParent(parent)
+            if branch == 'left':
+                parent.setLeftBranch(node)
+            else:
+                parent.setRightBranch(node)
+            stack.append((node, 'right'))
+            stack.append((node, 'left'))
+        return root
+
+    def save(self, fileName, binary=False):
+        # Write the log into a JSON file, or a binary file
+        # Output: fileName
+        if not binary:
+            with open(fileName, 'w') as f:
+                json.dump({'version': BINARY_VERSION, 'tree': self.getTree(), 'events': self.events}, f)
+            return fileName
+        # label table, then tree and event records referring to labels by index (-1 for None)
+        labels = []
+        index = {None: -1}
+        for label in self.getTree() + [label for kind, label, frames in self.events]:
+            if label not in index:
+                index[label] = len(labels)
+                labels.append(label)
+        data = [struct.pack('>4sHI', BINARY_MAGIC, BINARY_VERSION, len(labels))]
+        for label in labels:
+            text = label if isinstance(label, str) else label.encode('utf-8')
+            data.append(struct.pack('>H', len(text)) + text)
+        tree = self.getTree()
+        data.append(struct.pack('>I%di' % len(tree), len(tree), *[index[label] for label in tree]))
+        data.append(struct.pack('>I', len(self.events)))
+        for kind, label, frames in self.events:
+            data.append(struct.pack('>BiI', EVENT_KINDS.index(kind), index[label], frames))
+        with open(fileName, 'wb') as f:
+            f.write(''.join(data))
+        return fileName
+
+
+def loadSearchLog(fileName):
+    # Read a log written by searchLog.save(), as JSON or binary
+    # Output: searchLog object, with the tree searched held as node labels (see getRoot()),
+    #    labels are byte strings, as returned by str(node), from JSON or binary logs alike
+    with open(fileName, 'rb') as f:
+        data = f.read()
+    log = searchLog()
+    if not data.startswith(BINARY_MAGIC):
+        content = json.loads(data)
+        log.tree = [labelText(label) for label in content['tree']]
+        log.events = [(kind, labelText(label), frames) for kind, label, frames in content['events']]
+        return log
+    magic, version, count = struct.unpack_from('>4sHI', data)
+    if version != BINARY_VERSION:
+        raise RuntimeError("Error: search log " + fileName + " has unknown version " + str(version))
+    offset = struct.calcsize('>4sHI')
+    labels = []
+    for i in range(0, count):
+        length, = struct.unpack_from('>H', data, offset)
+        labels.append(data[offset+2:offset+2+length])
+        offset += 2 + length
+    count, = struct.unpack_from('>I', data, offset)
+    offset += 4
+    log.tree = [labels[i] if i >= 0 else None for i in struct.unpack_from('>%di' % count, data, offset)]
+    offset += 4 * count
+    count, = struct.unpack_from('>I', data, offset)
+    offset += 4
+    record = struct.Struct('>BiI')
+    for i in range(0, count):
+        kind, label, frames = record.unpack_from(data, offset + i * record.size)
+        log.events.append((EVENT_KINDS[kind], labels[label] if label >= 0 else None, frames))
+    return log
+
+
+def labelText(label):
+    # Return a label read from JSON as a byte string, as returned by str(node)
+    if isinstance(label, unicode):
+        return label.encode('utf-8')
+    return label
@@ -22,7 +22,10 @@ Public methods:
     setImageScaling()  - update default image scale factor
     setSpeedList()     - update default list of playback speeds
     setColorScheme()   - update default button color scheme
-    setIdleTimeSlice() - update defalut sleep time during idle loop
+    setIdleTimeSlice() - update defalut sleep time during idle loop (no longer used)
+    setFrameCache()    - update default number of decoded images to cache, and to prefetch ahead of playback
+    setMetricsExport() - export playback timing metrics as JSON when a slide show ends (see playbackMetrics class)
+    readTimeline()     - read a JSON timeline of images and hold times written by visualizeTree.writeFrameManifest()
     playSlides()       - launch a slide show   
 """
 
@@ -31,6 +34,15 @@ import Tkinter
 import Image, ImageTk
 
 import time
+import os
+import json
+import threading
+import bisect
+import math
+from collections import OrderedDict
+
+# Wall clock timer for playback timing and metrics, time.clock() measures processor time on some platforms.
+timer = getattr(time, 'perf_counter', time.time)
 
 # History:
 #   Initial project published on 12/11/2013
@@ -47,6 +59,19 @@ import time
 #   Rev 3a: 1/10/2014
 #       1) Improve clarity of idle loop
 #       2) Improve clarity of performance display in main playback loop
+#
+#   Rev 4: 10/16/2026
+#       1) Accept a JSON timeline (written by visualizeTree.writeFrameManifest()) in place of a play list,
+#            each image is held for its recorded number of frames.
+#       2) Accept image objects in the play list, as well as image file names (see visualizeTree.setRenderBackend()).
+#       3) Accept a frameStore (see frameStore.py) in place of a play list.
+#       4) Add frameCache class: a bounded LRU cache of decoded, scaled images (and their Tk images),
+#            filled by a background thread that prefetches the next images in the current play direction.
+#       5) Replace the polling loop with Tk after() deadlines: images are shown at drift free deadlines,
+#            nothing runs while paused, and a single image label is reused for every image.
+#       6) Add playbackMetrics class: per image decode, scale, Tk image build and present times, lateness against 
+#            each image's deadline, late and dropped image counts, with percentiles and histograms,
+#            reported at the end of playback when testPerformance is set, and optionally exported as JSON.
 
 
 class slideShow(object):
@@ -66,9 +91,8 @@ class slideShow(object):
                                                           #   where speedList pointer controlled by "Faster" and "Slower" buttons.
         self.speedPointerDefault = 3                      # The default wait time (during startup and after a reset) index within speedList[]. 
                                                           #   Recommended setting (integer): len(speedList)/2
-        self.idleTimeSlice = .01/2.1                      # Idle loop time slice between Tkinter updates. 
-                                                          #   Recommend setting based on Nyquist Interval (float): min(.1, speedList[0]/2.1),
-                                                          #   and the need for python code associated with button activity to be responsive to user.
+        self.idleTimeSlice = .01/2.1                      # No longer used: playback is scheduled with Tk's after(), there is no idle loop.
+                                                          #   Kept for compatibility with setIdleTimeSlice().
         
         # Button colors...
         self.bg_color_f = "#ccffff"  # Background color for buttons.
@@ -86,6 +110,15 @@ class slideShow(object):
         self.h_screen = None         # Height of screen: use None for auto-detection and auto-scaling, 
                                      #   otherwise set to maximum png height in pixels plus 70 for borders, title bar, and buttons (controller height only takes 66).                
         
+        # Decoded image cache...
+        self.cacheSize = 64          # Number of decoded, scaled images to keep, so replay and reverse playback skip decoding.
+        self.prefetchCount = 8       # Number of images to decode ahead of the current image, in the current play direction.
+        
+        # Playback metrics...
+        self.metrics = None          # playbackMetrics object for the most recent slide show.
+        self.metricsFileName = None  # JSON file to export playback metrics to when a slide show ends, or None.
+        self.lateTolerance = .005    # Seconds an image may be shown after its deadline before it is counted as late.
+        
     def setImageScaling(self, wMax, hMax):
         # Set maximum width and height values in pixels for png images. 
         #    Auto-scaling will take place when images are larger than these values.
@@ -100,10 +133,22 @@ class slideShow(object):
         self.speedPointerDefault = speedPointerDefault   
         
     def setIdleTimeSlice(self, idleTimeSlice):
-        # Update the default idle loop time slice. Use faster time for more responsive buttons. Use slower time for slower computers.
+        # Update the default idle loop time slice. No longer used, playback is scheduled with Tk's after().
         assert type(idleTimeSlice) == float, "Wait time between rootTk.update() calls should be a float. Example: idleTimeSlice = .05"
         self.idleTimeSlice = idleTimeSlice   
         
+    def setFrameCache(self, cacheSize, prefetchCount):
+        # Update the number of decoded images to keep, and the number to decode ahead of playback in a background thread.
+        assert cacheSize > prefetchCount, "Cache size should be larger than prefetch count. Example: cacheSize = 64, prefetchCount = 8"
+        self.cacheSize = cacheSize
+        self.prefetchCount = prefetchCount
+        
+    def setMetricsExport(self, metricsFileName, lateTolerance=.005):
+        # Export playback metrics as JSON to metricsFileName when a slide show ends (None to stop exporting).
+        #    An image shown more than lateTolerance seconds after its deadline is counted as late.
+        self.metricsFileName = metricsFileName
+        self.lateTolerance = lateTolerance
+        
     def setColorScheme(self, bg_color_f="#ccffff", bg_color_r="#ffffcc", fg_color_f="blue", fg_color_r="black"):  
         # Set text and background colors for buttons. The "_f" colors are used for initial buttons, and controller title. 
         #    The "_r" colors are used for revere playback on "play/pause" and "normal" buttons.
@@ -118,6 +163,8 @@ class slideShow(object):
         # manage WM_DELETE_WINDOW event
         self.closeViewer = True
         self.measureValid = False
+        self.cancelNextImage()
+        self.rootTk.quit()
         
     def tooglePlayPause(self):
         # Modify play loop for playback or pause. Auto pause when playback comes to an end.
@@ -136,6 +183,7 @@ class slideShow(object):
         else:
             # Auto pause when playback comes to an end.
             self.toogleReverse()
+        self.scheduleNextImage(restart=True)
              
     def incrementFaster(self):
         # Modify play loop for shorter delay between images.   
@@ -164,6 +212,9 @@ class slideShow(object):
             self.Faster.configure(text = 'Fastest') 
         else:
             self.Faster.configure(text = 'Faster')     
+        # Apply the new time to the image on display.
+        self.deadline = self.shownTime + self.holdTime()
+        self.scheduleNextImage()
          
     def toogleReverse(self):
         # Modify play loop for forward or reverse playback. 
@@ -177,11 +228,11 @@ class slideShow(object):
             self.reverseFlag = True 
             self.Reverse.configure(text = 'Normal', bg=self.bg_color_r, fg=self.fg_color_r)
             self.Play.configure(bg=self.bg_color_r, fg=self.fg_color_r)
+        self.prefetchImages()
     
     def doReset(self):
         # Modify play loop to initial state.
         self.measureValid = False  
-        self.resetJustHappened = True 
         self.setTime = self.speedList[self.speedPointerDefault]  
         self.speedPointerCurrent = self.speedPointerDefault
         self.updateSpeedButtons()
@@ -189,8 +240,78 @@ class slideShow(object):
             self.toogleReverse()
         if self.playFlag:   
             self.tooglePlayPause()
-        if self.imageCount != 0:  
-            self.imageCount = 0
+        self.imageCount = 0
+        self.showImage()
+
+    def holdTime(self):
+        # Return the time to display the current image: setTime, times the image's number of frames in a timeline.
+        return self.setTime * self.holdList[self.imageCount]
+        
+    def scheduleNextImage(self, restart=False):
+        # Schedule nextImage() at the current deadline using Tk's after(), or cancel it when playback is paused.
+        #    Deadlines advance by each image's hold time, not from the time an image was shown, so timing does not drift.
+        #    On restart (playback just started) the deadline is set from now, 
+        #    and the initial image is skipped over at once, as it has been on display while paused.
+        self.cancelNextImage()
+        if not self.playFlag or self.closeViewer:
+            return
+        now = timer()
+        if restart:
+            if (self.imageCount == 0 and not self.reverseFlag) or (self.imageCount == self.imageCountMax and self.reverseFlag):
+                self.deadline = now
+            else:
+                self.deadline = now + self.holdTime()
+        self.afterId = self.rootTk.after(max(0, int(round((self.deadline - now) * 1000))), self.nextImage)
+        
+    def cancelNextImage(self):
+        # Cancel a scheduled nextImage() call.
+        if self.afterId != None:
+            self.rootTk.after_cancel(self.afterId)
+            self.afterId = None
+            
+    def nextImage(self):
+        # Tk after() callback: display the next image in the play direction, or auto pause at the end of playback.
+        self.afterId = None
+        if (self.imageCount >= self.imageCountMax and not self.reverseFlag) or (self.imageCount <= 0 and self.reverseFlag):
+            # Stop playback, update play/pause button text.
+            self.tooglePlayPause()
+            # Toogle reverse playback so the user can play the png images in the other direction.
+            self.toogleReverse()
+            return
+        if self.reverseFlag:
+            self.imageCount -= 1
+        else:
+            self.imageCount += 1
+        self.showImage()
+        self.metrics.recordDeadline(self.shownTime - self.deadline, self.holdTime())
+        self.deadline += self.holdTime()
+        if self.deadline < self.shownTime - self.setTime:
+            # More than an image behind (a slow computer, or a busy display): start over from now, rather than rush to catch up.
+            self.deadline = self.shownTime
+        self.scheduleNextImage()
+        
+    def showImage(self):
+        # Display the current image, decoded and scaled ahead of time by the frame cache, then prefetch the images to follow.
+        photo = self.frameCache.getPhoto(self.imageCount)
+        presentTime = timer()
+        self.imageLabel.configure(image=photo)
+        self.imageLabel.image = photo   # keep a reference, the frame cache may drop its own
+        self.rootTk.update_idletasks()  # draw now, so present time and lateness include drawing the image
+        lastShownTime, self.shownTime = self.shownTime, timer()
+        self.metrics.record('present', self.shownTime - presentTime)
+        if self.testPerformance == True:
+            if self.measureValid:
+                print "deltaTime:", '{:2.5f}'.format(self.shownTime - lastShownTime), "imageCount:", "%02d" % (self.imageCount)
+            self.measureValid = True
+        self.prefetchImages()
+        
+    def prefetchImages(self):
+        # Decode the images to follow the current image in the play direction, in the background.
+        if self.frameCache:
+            if self.reverseFlag:
+                self.frameCache.prefetch(self.imageCount, -1)
+            else:
+                self.frameCache.prefetch(self.imageCount, 1)
 
     def scaleFactor(self):        
         # Determine visual environment, and generate width/height scale dimensions as needed.
@@ -203,7 +324,7 @@ class slideShow(object):
         if not self.h_screen:
             self.h_screen = self.rootTk.winfo_screenheight() - 70
         # Get width, height, and then initialize display using initial png image in sequence
-        image = Image.open(self.playList[0])
+        image = self.openImage(self.playList[0])
         w = image.size[0]
         h = image.size[1]
         
@@ -228,10 +349,47 @@ class slideShow(object):
         return (w, h, useScaleFactor)    
  
         
+    def openImage(self, f):
+        # Return an image from the play list: open an image file name, or use an image object as is.
+        if isinstance(f, basestring):
+            return Image.open(f)
+        return f
+
+    def readTimeline(self, timelineFileName):
+        # Read a JSON timeline written by visualizeTree.writeFrameManifest().
+        #    Image file names are stored relative to the timeline file.
+        # Output: Return tuple: list of images to play, and list of frames to hold each image.
+        with open(timelineFileName) as f:
+            timeline = json.load(f)
+        timelineDir = os.path.dirname(timelineFileName)
+        playList = [os.path.join(timelineDir, frame['file']) for frame in timeline['frames']]
+        holdList = [frame['frames'] for frame in timeline['frames']]
+        return (playList, holdList)
+        
+    def loadImage(self, index):
+        # Decode (and scale, when needed) an image from the play list, called by the frameCache prefetch thread.
+        startTime = timer()
+        image = self.openImage(self.playList[index])
+        image.load()
+        decodeTime = timer()
+        self.metrics.record('decode', decodeTime - startTime)
+        if self.useScale: 
+            image = image.resize((self.wScale, self.hScale), Image.ANTIALIAS) 
+            self.metrics.record('scale', timer() - decodeTime)
+        return image
+        
     def playSlides(self, playList, mainTitle="Slide Show", exitButtonText="Quit", testPerformance=False):
         # Main playback loop
+        #    playList is a list of image file names and/or image objects, a frameStore (see frameStore.py),
+        #    or the file name of a JSON timeline (see readTimeline()).
         
         self.initPrivateProps() 
+        
+        if isinstance(playList, basestring):
+            # A JSON timeline: hold each image for its number of frames (setTime seconds per frame).
+            playList, self.holdList = self.readTimeline(playList)
+        else:
+            self.holdList = [1] * len(playList)
           
         assert len(playList) > 0, 'Error: playList is a ist of images to play during slide show (example: playList = ["c:\tmp\im1.png", "c:\tmp\im2.png"...])' 
         self.playList = playList
@@ -250,7 +408,10 @@ class slideShow(object):
         self.setTime = self.speedList[self.speedPointerCurrent]     # Initialize time to wait between images during playback.
         self.imageCountMax = len(self.playList) - 1                 # Maximum image count [0 to n].                
         
-        wScale, hScale, useScale = self.scaleFactor()               # Calculate image scale details
+        self.wScale, self.hScale, self.useScale = self.scaleFactor()  # Calculate image scale details
+        self.metrics = playbackMetrics(self.lateTolerance)
+        self.frameCache = frameCache(self.loadImage, len(self.playList), self.cacheSize, self.prefetchCount, self.metrics)
+        self.frameCache.start()
               
         # group buttons together tightly using this frame
         frame = Tkinter.Frame(self.rootTk, width=100)
@@ -288,91 +449,24 @@ class slideShow(object):
         Exit = Tkinter.Button(frame, text = self.exitButtonText, bg=self.bg_color_f, fg=self.fg_color_f, command = self.setExitFlag)
         Exit.grid(row = 1, column = 7)
               
-        # Initialize main polling loop.
+        # define the image display, a single label reused for every image
+        self.imageLabel = Tkinter.Label(self.rootTk, relief="sunken")
+        self.imageLabel.grid(row=0, columnspan=6)
+              
+        # Initialize playback, then run Tk's event loop until the quit button or window exit button is pressed.
+        #    Images are advanced by Tk after() callbacks at each image's deadline, nothing runs while paused.
         self.doReset()
-        self.resetJustHappened = False   
-        startMeasureTime = 0.  # measureValid will is initialized to False during doReset()
-        
-        # Main polling loop.
-        while True:          
-            if self.testPerformance == True:
-                if self.measureValid:
-                    deltaTime = time.clock() - startMeasureTime
-                    print "deltaTime:", '{:2.5f}'.format(deltaTime), "imageCount:", "%02d" % (self.imageCount)                  
-                startMeasureTime = time.clock()
-                self.measureValid = True
-            
-            # Exit slide show if a quit button or exit window button was pressed.
-            if self.closeViewer:
-                break
-                        
-            # Display an image.
-            f = self.playList[self.imageCount]
-            image = Image.open(f)
-            if useScale: image = image.resize((wScale,hScale),Image.ANTIALIAS) 
-            # Use alternate image storage to avoid flicker.
-            if self.imageCount % 2 == 0:
-                tkpi = ImageTk.PhotoImage(image)        
-                label_image = Tkinter.Label(self.rootTk, image=tkpi, relief="sunken")
-                label_image.grid(row=0, columnspan=6)              
-            else:
-                tkpi2 = ImageTk.PhotoImage(image)        
-                label_image2 = Tkinter.Label(self.rootTk, image=tkpi2, relief="sunken")
-                label_image2.grid(row=0, columnspan=6)
-            self.rootTk.update()             
-            
-            # Initialize wait time.        
-            idleLoopTimeInit = time.clock() 
-            while True:
-                # Idle polling loop. Wait for user controls, ellapsed time to next image, or end of slide show.
-                
-                # update TK graphics thread.
-                self.rootTk.update()
-                
-                # Exit idle loop on quit/close
-                if self.closeViewer:
-                    break              
-                # Exit idle loop on reset
-                if self.resetJustHappened:
-                    break
-                    
-                # Skip idle loop on initial image.
-                if self.playFlag:
-                    if self.imageCount == 0 and not self.reverseFlag:
-                        self.measureValid = False
-                        break
-                    elif self.imageCount == self.imageCountMax and self.reverseFlag:
-                        self.measureValid = False
-                        break
-                    else: 
-                        if time.clock() - idleLoopTimeInit > self.setTime:
-                            # Re-initialize wait time unless playback is underway.        
-                            idleLoopTimeInit = time.clock()
-                            break
-                        # Update graphics display at least every idleTimeSlice seconds, even when we want to delay for a longer period of time.                                     
-                        time.sleep(self.idleTimeSlice)                                                      
-                
-            if self.imageCount >= self.imageCountMax and not self.reverseFlag:
-                # Stop normal playback, update play/pause button text, and wait in a loop.
-                self.tooglePlayPause()
-                # Toogle reverse playback so the user can play the png images in reverse direction.
-                self.toogleReverse()
-            
-            elif self.imageCount <= 0 and self.reverseFlag:
-                # Stop reverse playback, update play/pause button text, and wait in a loop.
-                self.tooglePlayPause()
-                # Toogle reverse playback so the user can play the png images in forward direction.
-                self.toogleReverse()
-                            
-            elif not self.resetJustHappened:
-                # Normal playback by incrementing/decrementing the png image to display.
-                if self.reverseFlag:
-                    self.imageCount -= 1
-                else:
-                    self.imageCount += 1
-            else:
-                # clear reset flag and return to main playback loop with all attributes reset
-                self.resetJustHappened = False                    
+        self.rootTk.mainloop()
+        
+        self.cancelNextImage()
+        self.frameCache.stop()
+        self.imageLabel.destroy()
+        frame.destroy()
+        
+        if self.testPerformance == True:
+            self.metrics.report()
+        if self.metricsFileName:
+            self.metrics.exportJson(self.metricsFileName)
         
     def initPrivateProps(self):                             
         # Private attributes for play loop and interactive button management.                             
@@ -386,4 +480,200 @@ class slideShow(object):
         self.Speed = None
         self.Faster = None
         self.Slower = None
-        self.resetJustHappened = False 
+        self.holdList = []
+        self.imageLabel = None
+        self.afterId = None
+        self.deadline = 0.
+        self.shownTime = 0.
+        self.frameCache = None
+        self.wScale = None
+        self.hScale = None
+        self.useScale = False
+
+
+################################################
+# Class frameCache
+################################################
+
+class frameCache(object):
+    # Bounded LRU cache of decoded, scaled images, filled ahead of playback by a background thread.
+    #    Tk images (ImageTk.PhotoImage) are only built, and released, on the Tk thread by getPhoto().
+    def __init__(self, loadImage, playListLength, cacheSize=64, prefetchCount=8, metrics=None):
+        self.loadImage = loadImage          # Function to decode and scale an image, given its play list index.
+        self.playListLength = playListLength  # Number of images in the play list.
+        self.cacheSize = cacheSize          # Maximum number of decoded images to keep.
+        self.prefetchCount = prefetchCount  # Number of images to decode ahead of the current image.
+        self.metrics = metrics              # playbackMetrics object to record Tk image build times and cache misses, or None.
+        self.images = OrderedDict()         # Decoded images by play list index, least recently used first.
+        self.photos = {}                    # Tk images by play list index, for images still in the cache.
+        self.lock = threading.Lock()
+        self.wakeUp = threading.Event()     # Set to start prefetching from a new position.
+        self.position = (0, 1)              # Current play list index, and play direction (1 or -1).
+        self.stopFlag = False
+        self.thread = None
+        
+    def start(self):
+        # Start the prefetch thread.
+        self.stopFlag = False
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+        
+    def stop(self):
+        # Stop the prefetch thread, and release cached images.
+        self.stopFlag = True
+        self.wakeUp.set()
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+        with self.lock:
+            self.images.clear()
+        self.photos.clear()
+        
+    def prefetch(self, index, direction):
+        # Decode the images that follow index in the play direction (1 forward, -1 reverse), in the background.
+        self.position = (index, direction)
+        self.wakeUp.set()
+        
+    def get(self, index):
+        # Return a decoded image, from the cache, or decoded now on a cache miss.
+        with self.lock:
+            image = self.images.pop(index, None)
+            if image != None:
+                self.images[index] = image   # most recently used
+                return image
+        image = self.loadImage(index)
+        self.put(index, image)
+        return image
+        
+    def getPhoto(self, index):
+        # Return a Tk image, must be called from the Tk thread.
+        with self.lock:
+            cached = index in self.images
+        image = self.get(index)
+        if self.metrics and not cached:
+            self.metrics.count('cacheMisses')
+        with self.lock:
+            for old in [i for i in self.photos if i not in self.images]:
+                del self.photos[old]
+        photo = self.photos.get(index)
+        if photo == None:
+            startTime = timer()
+            photo = ImageTk.PhotoImage(image)
+            self.photos[index] = photo
+            if self.metrics:
+                self.metrics.record('photo', timer() - startTime)
+        return photo
+        
+    def put(self, index, image):
+        # Add a decoded image, dropping the least recently used images past cacheSize.
+        with self.lock:
+            self.images.pop(index, None)
+            self.images[index] = image
+            while len(self.images) > self.cacheSize:
+                self.images.popitem(last=False)
+                
+    def run(self):
+        # Prefetch thread: decode images ahead of the current position, restart when the position changes.
+        while not self.stopFlag:
+            self.wakeUp.wait()
+            self.wakeUp.clear()
+            position = self.position
+            index, direction = position
+            for i in range(1, self.prefetchCount + 1):
+                if self.stopFlag or self.position != position:
+                    break
+                nextIndex = index + i * direction
+                if nextIndex < 0 or nextIndex >= self.playListLength:
+                    break
+                with self.lock:
+                    cached = nextIndex in self.images
+                if not cached:
+                    self.put(nextIndex, self.loadImage(nextIndex))
+
+
+################################################
+# Class playbackMetrics
+################################################
+
+class playbackMetrics(object):
+    # Timing samples and counters for a slide show, all times in seconds:
+    #    decode  - open and decode an image (usually on the prefetch thread),
+    #    scale   - resize an image to fit the screen,
+    #    photo   - build a Tk image (on the Tk thread),
+    #    present - configure the image label and draw it,
+    #    late    - time an image was shown after its deadline (negative when early).
+    # Counters: images played on a deadline, late images (beyond lateTolerance), 
+    #    dropped images (shown after their whole display time had passed), and frame cache misses.
+    histogramBuckets = [.001, .002, .005, .01, .02, .05, .1, .2, .5, 1.]   # bucket upper limits in seconds
+    
+    def __init__(self, lateTolerance=.005):
+        self.lateTolerance = lateTolerance
+        self.samples = {'decode': [], 'scale': [], 'photo': [], 'present': [], 'late': []}
+        self.counters = {'images': 0, 'lateImages': 0, 'droppedImages': 0, 'cacheMisses': 0}
+        self.lock = threading.Lock()   # decode and scale times are recorded by the prefetch thread
+        
+    def record(self, name, seconds):
+        # Add a timing sample.
+        with self.lock:
+            self.samples[name].append(seconds)
+            
+    def count(self, name):
+        # Increment a counter.
+        with self.lock:
+            self.counters[name] += 1
+            
+    def recordDeadline(self, lateness, holdTime):
+        # Record how late an image was shown against its deadline, given the time it should stay on display.
+        self.record('late', lateness)
+        self.count('images')
+        if lateness > self.lateTolerance:
+            self.count('lateImages')
+        if lateness > holdTime:
+            self.count('droppedImages')
+            
+    def summary(self):
+        # Return a dictionary of counters, and for each timing: count, mean, percentiles, maximum and histogram.
+        result = {'counters': dict(self.counters)}
+        with self.lock:
+            samples = dict([(name, sorted(values)) for name, values in self.samples.items()])
+        for name, values in samples.items():
+            if not values:
+                continue
+            histogram = []
+            below = 0
+            for limit in self.histogramBuckets:
+                upTo = bisect.bisect_right(values, limit)
+                histogram.append(['<=%gms' % (limit * 1000), upTo - below])
+                below = upTo
+            histogram.append(['>%gms' % (self.histogramBuckets[-1] * 1000), len(values) - below])
+            result[name] = {'count': len(values), 
+                            'mean': sum(values) / len(values),
+                            'p50': percentile(values, 50),
+                            'p90': percentile(values, 90),
+                            'p99': percentile(values, 99),
+                            'max': values[-1],
+                            'histogram': histogram}
+        return result
+        
+    def report(self):
+        # Print a summary to standard output.
+        result = self.summary()
+        print "Playback metrics:", ", ".join(["%s: %d" % item for item in sorted(result['counters'].items())])
+        for name in ('decode', 'scale', 'photo', 'present', 'late'):
+            if name in result:
+                s = result[name]
+                print "  %-8s n=%-5d mean=%8.2fms p50=%8.2fms p90=%8.2fms p99=%8.2fms max=%8.2fms" % (
+                    name, s['count'], s['mean'] * 1000, s['p50'] * 1000, s['p90'] * 1000, s['p99'] * 1000, s['max'] * 1000)
+                print "           " + " ".join(["%s:%d" % (bucket, n) for bucket, n in s['histogram'] if n])
+                
+    def exportJson(self, fileName):
+        # Write the summary as JSON.
+        with open(fileName, 'w') as f:
+            json.dump(self.summary(), f, indent=1, sort_keys=True)
+
+
+def percentile(sortedValues, p):
+    # Return the p-th percentile (nearest rank) of a sorted list of values.
+    rank = int(math.ceil(p / 100. * len(sortedValues))) - 1
+    return sortedValues[min(max(rank, 0), len(sortedValues) - 1)]
@@ -0,0 +1,68 @@
+"""
+File: treeLayout.py
+
+ Support Module for: Animate a Binary Search Tree using Python, pyDot, GraphViz
+
+ Project home: http://www.embeddedcomponents.com/blogs/2013/12/visualizing-software-tree-structures/
+
+ Developed by Ron Fredericks, Video Technologist, at LectureMaker LLC, http://www.LectureMaker.com
+    MIT License, Copyright (c) 2013, Ron Fredericks
+    Free to use following these terms: http://opensource.org/licenses/MIT
+
+ Revision 4: 10/16/2026
+
+#############################################################
+# Native binary tree layout
+#############################################################
+
+Compute node positions for a binary tree in linear time, as an alternative to GraphViz's dot layout.
+
+    Each node's x position is its rank in an in-order walk of the tree, and its y position is its depth.
+    In a binary search tree this places every left child to the left of its parent, and every right child
+    to the right of its parent, so no node is ever drawn directly below its parent: the job done by
+    the invisible placeholder nodes and weighted edges of visualizeTree's sketchTree() for dot.
+
+    A tree node must provide these methods for this module to work:
+        getLeftBranch()
+        getRightBranch()
+    Nodes are named by str(node), the same names used by visualizeTree's draw() method.
+
+Public functions:
+    inorderLayout()  - return each node's (x, y) position in points, as used by GraphViz ("neato -n2")
+"""
+
+# History:
+#   Rev 4: 10/16/2026
+#       1) Create (this) treeLayout.py module: in-order x, depth y layout, without recursion or placeholder nodes.
+
+
+def inorderLayout(root, xStep=36., yStep=72.):
+    """
+    Lay out a binary tree: x from in-order rank, y from depth, root at the top.
+
+    Input:
+        root: root node of the tree, or None,
+        xStep: float, horizontal distance in points between nodes adjacent in order (72 points per inch),
+        yStep: float, vertical distance in points between tree levels.
+    Output:
+        dictionary of node name (str(node)) to (x, y) position in points,
+            with y increasing upward, as in GraphViz coordinates.
+    """
+    ranks = []      # (node name, depth) in order
+    stack = []
+    node, depth = root, 0
+    while stack or node:
+        if node:
+            stack.append((node, depth))
+            node, depth = node.getLeftBranch(), depth + 1
+        else:
+            node, depth = stack.pop()
+            ranks.append((str(node), depth))
+            node, depth = node.getRightBranch(), depth + 1
+    if not ranks:
+        return {}
+    maxDepth = max([nodeDepth for name, nodeDepth in ranks])
+    positions = {}
+    for rank, (name, depth) in enumerate(ranks):
+        positions[name] = (rank * xStep, (maxDepth - depth) * yStep)
+    return positions
@@ -0,0 +1,137 @@
+"""
+File: treeRaster.py
+
+ Support Module for: Animate a Binary Search Tree using Python, and the python image library
+
+ Project home: http://www.embeddedcomponents.com/blogs/2013/12/visualizing-software-tree-structures/
+
+ Developed by Ron Fredericks, Video Technologist, at LectureMaker LLC, http://www.LectureMaker.com
+    MIT License, Copyright (c) 2013, Ron Fredericks
+    Free to use following these terms: http://opensource.org/licenses/MIT
+
+ Revision 4: 10/16/2026
+
+#############################################################
+# Class treeRaster
+#############################################################
+
+Draw tree frames straight into in-memory images, as an alternative to rendering DOT text with GraphViz.
+
+    Node positions come from a computed layout (dot -Tplain, or treeLayout.inorderLayout()), in points.
+    Edges, and nodes in their default color, are drawn once into a base image.
+    Each frame is a copy of the base image with only the recolored nodes drawn again,
+    so no GraphViz process, png compression, or image file is needed in the frame loop.
+
+Public methods:
+    treeRaster(positions, nodes, edges) - instantiate a rasterizer for a tree layout
+    drawFrame()                         - return an image of the tree with some nodes recolored
+"""
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    import Image, ImageDraw, ImageFont
+
+import math
+
+# History:
+#   Rev 4: 10/16/2026
+#       1) Create (this) treeRaster.py module to draw frames in-process with the python image library.
+
+
+# GraphViz uses X11 color names, a few of which differ from the python image library's color names
+X11_COLORS = {'grey': '#bebebe', 'gray': '#bebebe', 'green': '#00ff00'}
+
+
+class treeRaster(object):
+    def __init__(self, positions, nodes, edges, defaultColor='grey', edgeColor='blue',
+                 nodeRadius=27., pad=21.6, dpi=96., maxSize=(19.2, 10.1)):
+        # Input:
+        #     positions is a dictionary of node name to (x, y) position in points, with y increasing upward,
+        #     nodes is a list of node names to draw (invisible placeholder nodes left out),
+        #     edges is a list of (parent name, child name) tuples to draw,
+        #     nodeRadius and pad are in points (72 points per inch), same as GraphViz's 0.75 inch circle and pad=.3,
+        #     dpi is the image resolution, and maxSize the largest (width, height) in inches, same as GraphViz's "size".
+        self.positions = positions
+        self.nodes = nodes
+        self.defaultColor = defaultColor
+        self.nodeRadius = nodeRadius
+
+        # Fit the layout within maxSize inches, GraphViz only ever shrinks a drawing to fit.
+        xs = [positions[name][0] for name in nodes] or [0.]
+        ys = [positions[name][1] for name in nodes] or [0.]
+        margin = nodeRadius + pad
+        self.minX = min(xs) - margin
+        self.maxY = max(ys) + margin
+        widthPoints = max(xs) + margin - self.minX
+        heightPoints = self.maxY - (min(ys) - margin)
+        fit = min(1., maxSize[0] * 72. / widthPoints, maxSize[1] * 72. / heightPoints)
+        self.pixelsPerPoint = fit * dpi / 72.
+        self.size = (int(math.ceil(widthPoints * self.pixelsPerPoint)), int(math.ceil(heightPoints * self.pixelsPerPoint)))
+
+        self.font = loadFont(int(round(14 * self.pixelsPerPoint)))
+        self.base = Image.new('RGB', self.size, 'white')
+        draw = ImageDraw.Draw(self.base)
+        for parent, child in edges:
+            if parent in positions and child in positions:
+                self.drawEdge(draw, parent, child, edgeColor)
+        for name in nodes:
+            self.drawNode(draw, name, defaultColor)
+
+    def drawFrame(self, nodeColors):
+        # Return an image of the tree, with nodes recolored
+        # Input: nodeColors is a dictionary of node name to fill color, for nodes not in their default color
+        image = self.base.copy()
+        draw = ImageDraw.Draw(image)
+        for name, color in nodeColors.items():
+            if name in self.positions and color != self.defaultColor:
+                self.drawNode(draw, name, color)
+        return image
+
+    def pixel(self, name):
+        # Return the (x, y) pixel position of a node, with y increasing downward
+        x, y = self.positions[name]
+        return ((x - self.minX) * self.pixelsPerPoint, (self.maxY - y) * self.pixelsPerPoint)
+
+    def drawNode(self, draw, name, color):
+        # Draw a filled circle with a centered label
+        x, y = self.pixel(name)
+        r = self.nodeRadius * self.pixelsPerPoint
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=X11_COLORS.get(color, color), outline='black')
+        w, h = textSize(draw, name, self.font)
+        draw.text((x - w / 2., y - h / 2.), name, fill='black', font=self.font)
+
+    def drawEdge(self, draw, parent, child, color):
+        # Draw a line from parent to child, with a "vee" arrowhead touching the child's circle
+        x0, y0 = self.pixel(parent)
+        x1, y1 = self.pixel(child)
+        length = math.hypot(x1 - x0, y1 - y0)
+        if length == 0:
+            return
+        ux, uy = (x1 - x0) / length, (y1 - y0) / length
+        r = self.nodeRadius * self.pixelsPerPoint
+        tipX, tipY = x1 - ux * r, y1 - uy * r
+        draw.line((x0, y0, tipX, tipY), fill=color, width=max(1, int(round(self.pixelsPerPoint))))
+        a = 10. * self.pixelsPerPoint   # arrowhead length
+        w = 3.5 * self.pixelsPerPoint   # arrowhead half width
+        backX, backY = tipX - ux * a, tipY - uy * a
+        notchX, notchY = tipX - ux * a * .6, tipY - uy * a * .6
+        draw.polygon([(tipX, tipY), (backX - uy * w, backY + ux * w), (notchX, notchY), (backX + uy * w, backY - ux * w)], fill=color)
+
+
+def loadFont(size):
+    # Return a scalable font close to GraphViz's default, or the python image library's built in font
+    for fontName in ('DejaVuSerif.ttf', 'times.ttf', 'DejaVuSans.ttf', 'arial.ttf'):
+        try:
+            return ImageFont.truetype(fontName, max(size, 6))
+        except IOError:
+            pass
+    return ImageFont.load_default()
+
+
+def textSize(draw, text, font):
+    # Return the (width, height) of text in pixels
+    if hasattr(draw, 'textbbox'):
+        left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+        return (right - left, bottom - top)
+    return draw.textsize(text, font=font)
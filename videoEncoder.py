@@ -0,0 +1,90 @@
+"""
+File: videoEncoder.py
+
+ Support Module for: Animate a Binary Search Tree using Python, pyDot, GraphViz, and FFmpeg utility
+
+ Project home: http://www.embeddedcomponents.com/blogs/2013/12/visualizing-software-tree-structures/
+
+ Developed by Ron Fredericks, Video Technologist, at LectureMaker LLC, http://www.LectureMaker.com
+    MIT License, Copyright (c) 2013, Ron Fredericks
+    Free to use following these terms: http://opensource.org/licenses/MIT
+
+ Revision 4: 10/16/2026
+
+#############################################################
+# Class videoEncoder
+#############################################################
+
+Encode png images into mpeg-4 video as they are produced, using a single FFmpeg process.
+
+    Images are piped to FFmpeg's image2pipe demuxer, so no png image needs to be written to disk,
+    and encoding runs at the same time as the search it records.
+    Images drawn in-process (see treeRaster.py) are piped as raw RGB video frames, skipping png compression.
+    The default FFmpeg settings match png2mpg4.bat: 1 second per image on input, 30 fps HD video on output.
+
+Public methods:
+    videoEncoder(videoFileName) - instantiate an encoder for the named video file
+    setOutputOptions()          - update default FFmpeg output options (bitrate, codec, frame rate, scaling)
+    write()                     - send a png image, or an RGB image object, to the video, held for a number of frames
+    close()                     - finish the video file
+"""
+
+import subprocess
+
+# History:
+#   Rev 4: 10/16/2026
+#       1) Create (this) videoEncoder.py module to stream frames into FFmpeg, in place of png2mpg4.bat.
+#       2) Accept RGB image objects, piped to FFmpeg as raw video frames.
+
+
+class videoEncoder(object):
+    def __init__(self, videoFileName, inputRate=1, ffmpeg='ffmpeg'):
+        self.videoFileName = videoFileName  # string, full path of the video file to write (example: movie.mp4)
+        self.inputRate = inputRate          # integer, images per second read from the pipe, same as "-r 1" in png2mpg4.bat
+        self.ffmpeg = ffmpeg                # string, FFmpeg program name, or full path when FFmpeg is not on the PATH
+        self.process = None                 # FFmpeg process, started on the first call to write()
+        self.frameCount = 0                 # integer, number of frames sent to the video
+        self.setOutputOptions()
+
+    def setOutputOptions(self, bitRate='5000k', vcodec='mpeg4', outputRate=30,
+                         scale="'if(gt(a,4/3),1920,-1)':'if(gt(a,4/3),-1,1280)'"):
+        # Update FFmpeg output options, see png2mpg4.bat for a description of each option
+        self.outputOptions = ['-b:v', bitRate, '-vcodec', vcodec, '-r', str(outputRate)]
+        if scale:
+            self.outputOptions += ['-vf', 'scale=' + scale]
+
+    def open(self, rawSize=None):
+        # Start FFmpeg, reading png images from its standard input,
+        #    or raw RGB frames of rawSize (width, height) pixels
+        if rawSize:
+            command = [self.ffmpeg, '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24', 
+                       '-s', '%dx%d' % rawSize, '-r', str(self.inputRate), '-i', '-']
+        else:
+            command = [self.ffmpeg, '-loglevel', 'error', '-f', 'image2pipe', '-vcodec', 'png', '-r', str(self.inputRate), '-i', '-']
+        self.process = subprocess.Popen(command + self.outputOptions + ['-y', self.videoFileName], stdin=subprocess.PIPE)
+        self.frameCount = 0
+
+    def write(self, imageData, frames=1):
+        # Send a png image (file contents, not a file name) to the video, held for a number of frames,
+        #    or an RGB image object, all of the same size, when the video was started with one.
+        if not isinstance(imageData, basestring):
+            if self.process == None:
+                self.open(imageData.size)
+            imageData = imageData.tobytes()
+        if self.process == None:
+            self.open()
+        for i in range(0, frames):
+            self.process.stdin.write(imageData)
+        self.frameCount += frames
+
+    def close(self):
+        # Finish the video file
+        # Output: video file name, or raise RuntimeError when FFmpeg fails
+        if self.process == None:
+            return self.videoFileName
+        self.process.stdin.close()
+        returnCode = self.process.wait()
+        self.process = None
+        if returnCode != 0:
+            raise RuntimeError("Error: " + self.ffmpeg + " failed to encode " + self.videoFileName + ", exit code " + str(returnCode))
+        return self.videoFileName
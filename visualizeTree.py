@@ -29,15 +29,57 @@ External search functions included:
     DFSOrdered()  - animate an ordered search using depth first search    
     BFS()         - animate a search using breath first search
     
+    Search functions receive the key searched for as a searchKey, in place of a string (before Revision 4):
+        compare it with node.getValue(), so keys compare in their own type (9 < 10).
+        Search functions written for a string key, comparing it with str(node.getValue()), still work:
+        a searchKey compared with a string compares as a string ("10" < "9"), as before.
+    Search functions receive the search frontier as a searchFrontier (a deque):
+        appendleft() adds a node to be searched next, append() adds a node to be searched last,
+        both in constant time. insert(0, node) still works for search functions written for a list.
+    
 Public drawing methods:
     sketchTree()          - draw a tree  
     searchTree()          - search a tree (using a search function as described above), with animated trail of search
     setVidFrames()        - number of png images to generate for each step in the video
+    setLayoutCache()      - compute the tree layout once, and render each later frame with node positions pinned
+    setLayoutEngine()     - compute the tree layout with GraphViz's dot, or natively in linear time (see treeLayout.py)
+    setRenderBackend()    - render frames with GraphViz, or draw them in-process as images (see treeRaster.py)
+    setFrameManifest()    - render each distinct png image once, and record how long to hold it in a frame manifest
+    writeFrameManifest()  - write the frame manifest as an ffmpeg concat file and a JSON timeline for "slideShow" class
+    setRenderJobs()       - number of GraphViz processes used to render png images in parallel, and frames per process
+    flushGraph()          - wait until every png image queued for rendering has been written
+    setVideoEncoder()     - stream each png image into an FFmpeg video file as it is rendered
+    finishVideo()         - finish the video file started by setVideoEncoder()
     updateGraph()         - generate a png image
     appendVisualizeList() - add a png image name to a list for use with "showVideo" class         
+    setFrameStore()       - hold the visualizeList frames in memory up to a memory budget (see frameStore.py)
+    setWriteImages()      - write png image files, or keep frames in memory only
+    setHeadless()         - search without drawing or rendering, to time searches of very large trees
+    clearGraph()          - remove every node and edge drawn, to draw a tree again after its shape changed
+    setNodeState()        - change a drawn node's attributes (fill color, style) in place
+    frameDiff()           - return the nodes changed since the sketch, and their changed attributes
+    dotText()             - return the DOT text of the current frame, from a cached copy of the tree's static structure
+    drawRotation()        - draw a tree again after a rotation, with the rotated node highlighted (see binaryTree.avlTree)
+    resetGraph()          - return every node to its sketched colors, to search the same tree again without sketching it again
+    setRenderCache()      - reuse png images rendered by GraphViz, by this run or an earlier one (see renderCache.py)
+    showFrame()           - add the current drawing to the animation, held for a number of frames
+    holdFrame()           - hold the current drawing in the video, without adding it to the visualizeList
+    setSearchLog()        - record each search as events, to save and replay later (see searchLog.py)
+    replaySearch()        - render a recorded search again, at a chosen speed, or within a frame budget
 """
 
 import pydot
+import shlex
+import os
+import json
+from collections import deque
+
+import frameRenderer
+import videoEncoder
+import treeLayout
+import frameStore
+import searchLog
+import renderCache
 
 # History:
 #   Initial project published on 12/11/2013
@@ -67,6 +109,42 @@ import pydot
 #       2) Include special case to support drawing a one node tree: see draw(), and sketchTree() for details.
 #       3) Create new visualizeList[] list to hold a subset of images generated by visualizeTree() class,
 #            to display using a new interactive Tkinter Slideshow() class. 
+#
+#   Rev 4: 10/16/2026
+#       1) Add a layout cache: run dot's layout once on the sketched tree (dot -Tplain), pin each node at its position,
+#            and render every later search frame with "neato -n2" so only colors change between frames.
+#       2) Add a frame manifest mode: each distinct png image is rendered once and held for vidFrames frames,
+#            see writeFrameManifest() for the ffmpeg concat file and JSON timeline it produces.
+#       3) Add parallel rendering: capture each frame's DOT text and render it in a pool of GraphViz processes,
+#            see setRenderJobs() and the new frameRenderer.py module.
+#       4) Add batch rendering: send up to batchSize frames to a single GraphViz process (see setRenderJobs()),
+#            searchTree() flushes the queued frames before it returns.
+#       5) Add video streaming: pipe each rendered png image straight into FFmpeg (see setVideoEncoder(), 
+#            and the new videoEncoder.py module), writing png image files becomes optional.
+#       6) Add a native layout engine: in-order x, depth y node positions computed in linear time (see setLayoutEngine(), 
+#            and the new treeLayout.py module), no invisible placeholder nodes are drawn when it is used.
+#       7) Add a pillow render backend: draw frames in-process from the cached layout (see setRenderBackend(),
+#            and the new treeRaster.py module), images go straight to the video encoder and the visualizeList.
+#       8) Hold the visualizeList in a frameStore: frames rendered in memory stay in memory up to a memory budget,
+#            older frames spill to disk (see setFrameStore(), setWriteImages(), and the new frameStore.py module).
+#       9) Hold the search frontier in a searchFrontier deque: constant time at both ends, in place of list pop(0) and insert(0),
+#            add a headless mode to search without drawing (see setHeadless()).
+#       10) Add clearGraph() to draw a tree again after its shape changed, and drawRotation() to animate 
+#            the rotations of a self-balancing tree (see binaryTree.avlTree).
+#       11) Compare keys in their own type during a search (see searchKey, searchTree()'s new key argument, and DFSOrdered()),
+#            in place of comparing strings.
+#       12) Recolor nodes in place, in a node state table (see setNodeState()), in place of adding a pydot node per color change:
+#            the DOT text no longer grows with each frame, and frameDiff() returns a frame as a diff against the sketch.
+#       13) Write each frame's DOT text with dotText(): the static structure is serialized by pydot once and cached,
+#            and only the changed nodes are written per frame, rendered with frameRenderer in place of pydot's create() and write_png().
+#       14) Record each search as a log of events (visit, found, exhausted, frame, hold), see setSearchLog() and the new searchLog.py module,
+#            searchTree() plays each event as it searches, and replaySearch() renders a saved log again at a chosen speed or frame budget.
+#       15) Add resetGraph(): search a tree again keeping its sketch and layout, used by the new batchAnimation.py command line tool.
+#       16) Add a render cache: png images are looked up by a hash of their DOT text and render options before running GraphViz,
+#            and hard linked into the png image sequence when found (see setRenderCache(), and the new renderCache.py module).
+#            With render jobs, a frame queued twice before flushGraph() is rendered once, and copied to its other png images.
+#       17) Render video encoder frames, and frames kept in memory, in the render jobs pool (see setRenderJobs()): 
+#            queued frames are streamed to the encoder and appended to the visualizeList in frame order by flushGraph().
 #       
 
 
@@ -79,11 +157,37 @@ class visualizeTree(object):
                                     #   a way to stretch the video time line.
         self.fileCount = fileCount  # integer, first number to use with generate sequenced image files.                                    
         
-        self.treeList = []       # storage for the DFS or BFS tree search as a queue or stack
+        self.treeList = searchFrontier()  # storage for the DFS or BFS tree search as a queue or stack
+        self.headless = False    # boolean, search without drawing or rendering (see setHeadless())
+        self.searchCount = 0     # integer, number of nodes visited by the most recent searchTree()
         self.nodeNames = {}      # store each node name (key) with each node's pyDot object (value), used by draw() method to ensure each node is drawn once
         self.fullFileName = ""   # store the current full file name for png images
+        self.useLayoutCache = False  # boolean, render frames with node positions pinned (see setLayoutCache())
+        self.layoutCache = {}        # store each node name (key) with its (x, y) position in points, computed once by cacheLayout()
+        self.layoutEngine = 'dot'    # string, "dot" for GraphViz's layout, or "native" for treeLayout.inorderLayout()
+        self.treeRoot = None         # root node of the tree most recently sketched or searched, used by the native layout
+        self.useFrameManifest = False  # boolean, render each distinct png image once (see setFrameManifest())
+        self.frameManifest = []        # store (full file name, number of video frames to hold the image) for each png image 
+        self.frameTime = 1.            # float, seconds per video frame, matches "-r 1" in the ffmpeg png to video batch file
+        self.renderer = None           # frameRenderer object used to render png images in parallel (see setRenderJobs())
+        self.encoder = None            # videoEncoder object used to stream png images into a video file (see setVideoEncoder())
+        self.writeImages = True        # boolean, write png image files (see setWriteImages())
+        self.renderBackend = 'graphviz'  # string, "graphviz" to render DOT text, or "pillow" to draw frames in-process
+        self.raster = None               # treeRaster object used by the pillow render backend, built from the layout cache
+        self.dotPrefix = None            # DOT text of the graph's static structure, without its closing brace, cached by dotText()
+        self.frameData = None            # the most recent frame rendered in memory: png image data, an image,
+                                         #   or a frameRenderer.renderedImage until flushGraph() (see setRenderJobs())
+        self.nodeStates = {}             # node state table: each changed node name (key) with its attributes changed since the sketch (value)
+        self.sketchStates = {}           # each changed node name (key) with the sketch's value of each changed attribute (value)
+        self.searchLog = None            # searchLog object recording each search and frame shown, or None to not record them (see setSearchLog())
+        self.renderCache = None          # renderCache object holding png images rendered by GraphViz (see setRenderCache())
+        self.cachePending = []           # (cache key, file name) of each png image queued for rendering, cached by flushGraph()
+        self.pendingKeys = {}            # each cache key queued for rendering (key) with the frame rendering it (value), see writeGraph()
+        self.duplicatePending = []       # (cache key, file name) of each png image of a frame already queued, copied by flushGraph()
+        self.encoderPending = []         # (frame, video frames) of each frame queued for rendering, streamed to the encoder by flushGraph()
+        self.listPending = []            # each frame queued for rendering, appended to the visualizeList by flushGraph()
         
-        self.visualizeList = []  # hold unique png files for Tkinter display
+        self.visualizeList = frameStore.frameStore()  # hold unique png files (or in-memory frames) for Tkinter display
         
         self.initGraph(graph_type='digraph', nodesep=.5, pad=.3, size="19.2, 10.1")
         self.setNodeDefaults(style="filled", fillcolor="grey", shape="circle")
@@ -103,6 +207,7 @@ class visualizeTree(object):
         #     bgcolor="red" set the background color
         #     label="hello" set a text label just below the graph
         self.graph = pydot.Dot(**kwargs)
+        self.dotPrefix = None
 
     def setNodeDefaults(self, **kwargs):        
         # Set default node attributes
@@ -116,6 +221,7 @@ class visualizeTree(object):
         #     height and width float_value inches, for example: height=1.5, width=1.5
         #     text control: 'fontcolor', 'fontsize', 'label', 'fontname',  
         self.graph.set_node_defaults(**kwargs)    
+        self.dotPrefix = None
 
     def setEdgeDefaults(self, **kwargs):        
         # Set edge attributes
@@ -127,31 +233,265 @@ class visualizeTree(object):
         #     minlen=2 minimum edge length in inches (default is 1
         #     weight="0" to "100"
         self.graph.set_edge_defaults(**kwargs)        
+        self.dotPrefix = None
       
     def setVidFrames(self, vidFrames):
         # Method to control the number of duplicate png images to generate (ie stretch or shrink video time)          
         self.vidFrames = vidFrames
 
-    def searchTree(self, root, searchMethod, find=None):
+    def setLayoutCache(self, useLayoutCache=True):
+        # Method to compute the tree layout once, and render every later frame with node positions pinned.
+        #    The tree's shape never changes during a search, only node colors do, 
+        #    so there is no need for dot to re-run its full layout for each png image.
+        self.useLayoutCache = useLayoutCache
+        self.layoutCache = {}
+        self.dotPrefix = None
+
+    def setLayoutEngine(self, layoutEngine):
+        # Method to select how node positions are computed, call before sketchTree() draws the tree:
+        #    "dot" runs GraphViz's layout (the default), with invisible placeholder nodes to spread the tree out,
+        #    "native" uses treeLayout.inorderLayout() in linear time, without placeholder nodes.
+        # Both engines render frames with node positions pinned (see setLayoutCache()).
+        assert layoutEngine in ('dot', 'native'), 'Error: layout engine should be "dot" or "native"'
+        self.layoutEngine = layoutEngine
+        self.setLayoutCache()
+
+    def setRenderBackend(self, renderBackend):
+        # Method to select how frames are rendered:
+        #    "graphviz" renders each frame's DOT text with a GraphViz program (the default),
+        #    "pillow" draws each frame in-process from the cached layout, with treeRaster.
+        # With "pillow" and writeImages set to False (see setWriteImages()), 
+        #    frames are kept as images in the visualizeList, and no png image file is written.
+        assert renderBackend in ('graphviz', 'pillow'), 'Error: render backend should be "graphviz" or "pillow"'
+        self.renderBackend = renderBackend
+        self.raster = None
+        if renderBackend == 'pillow':
+            self.useLayoutCache = True
+
+    def rasterGraph(self):
+        # Method to draw the current graph as an image, using the pillow render backend
+        if not self.layoutCache or not self.raster:
+            if not self.layoutCache:
+                self.cacheLayout()
+            nodes = [name for name, node in self.nodeNames.items() if node.get_style() != 'invisible']
+            edges = [(edge.get_source().strip('"'), edge.get_destination().strip('"')) 
+                     for edge in self.graph.get_edges() if edge.get_style() != 'invisible']
+            import treeRaster   # the python image library is only required by the pillow render backend
+            self.raster = treeRaster.treeRaster(self.layoutCache, nodes, edges)
+        nodeColors = dict([(name, state['fillcolor']) for name, state in self.nodeStates.items() if 'fillcolor' in state])
+        return self.raster.drawFrame(nodeColors)
+
+    def cacheLayout(self):
+        # Method to run the layout once on the current graph, and pin each node at its computed position
+        #    dot -Tplain lines of interest: "node name x y width height label style shape color fillcolor", 
+        #    where x and y are in inches, converted here to points for use with "neato -n2".
+        #    The native layout engine returns points directly.
+        self.dotPrefix = None   # node positions are part of the static structure
+        if self.layoutEngine == 'native':
+            self.layoutCache = treeLayout.inorderLayout(self.treeRoot)
+            for name, position in self.layoutCache.items():
+                if name in self.nodeNames:
+                    self.nodeNames[name].set('pos', '%.2f,%.2f!' % position)
+            return
+        self.layoutCache = {}
+        for line in self.graph.create(prog='dot', format='plain').splitlines():
+            fields = shlex.split(line)
+            if len(fields) > 3 and fields[0] == 'node':
+                position = (float(fields[2]) * 72., float(fields[3]) * 72.)
+                self.layoutCache[fields[1]] = position
+                if fields[1] in self.nodeNames:
+                    self.nodeNames[fields[1]].set('pos', '%.2f,%.2f!' % position)
+
+    def setFrameManifest(self, useFrameManifest=True, frameTime=1.):
+        # Method to render each distinct png image once, instead of writing vidFrames duplicate copies.
+        #    The number of frames to hold each image is recorded in a frame manifest, see writeFrameManifest().
+        #    Set useFrameManifest to False to return to the numbered png image sequence used by png2mpg4.bat.
+        self.useFrameManifest = useFrameManifest
+        self.frameTime = frameTime
+        
+    def writeFrameManifest(self, manifestName=None):
+        # Method to write the frame manifest into fileDir as:
+        #    an ffmpeg concat demuxer file (example: ffmpeg -f concat -i bst_graph.ffconcat ... movie.mp4), and
+        #    a JSON timeline for use with slideShow.playSlides().
+        # Output: tuple of the two file names written
+        if manifestName == None:
+            manifestName = self.fileName
+        concatFileName = self.fileDir + manifestName + '.ffconcat'
+        timelineFileName = self.fileDir + manifestName + '.json'
+        
+        lines = ['ffconcat version 1.0']
+        timeline = {'frameTime': self.frameTime, 'frames': []}
+        for fileName, frames in self.frameManifest:
+            lines.append("file '%s'" % os.path.basename(fileName))
+            lines.append('duration %g' % (frames * self.frameTime))
+            timeline['frames'].append({'file': os.path.basename(fileName), 'frames': frames})
+        if self.frameManifest:
+            # the concat demuxer ignores the duration of its last entry, so list the last image once more
+            lines.append("file '%s'" % os.path.basename(self.frameManifest[-1][0]))
+            
+        with open(concatFileName, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        with open(timelineFileName, 'w') as f:
+            json.dump(timeline, f, indent=1)
+        return (concatFileName, timelineFileName)
+
+    def setRenderJobs(self, jobs, batchSize=1):
+        # Method to render png images in a pool of "jobs" GraphViz processes, or one at a time when jobs is 1 (the default).
+        #    Each GraphViz process renders a batch of up to batchSize frames, saving the cost of a process per frame.
+        #    Each frame's DOT text is captured during updateGraph(), so image order and file numbering are unchanged.
+        #    Frames for the video encoder, or kept in memory (see setWriteImages()), are rendered by the same pool,
+        #    then streamed to the encoder and appended to the visualizeList in frame order by flushGraph().
+        #    Call flushGraph() before using the png images.
+        self.flushGraph()
+        if self.renderer:
+            self.renderer.close()
+        self.renderer = None
+        if jobs > 1 or batchSize > 1:
+            self.renderer = frameRenderer.frameRenderer(jobs, batchSize)
+            
+    def flushGraph(self):
+        # Method to wait until every png image queued for rendering has been written
+        if self.renderer:
+            self.renderer.flush()
+        pending, self.cachePending = self.cachePending, []
+        for key, fileName in pending:
+            if isinstance(fileName, frameRenderer.renderedImage):
+                self.renderCache.store(key, fileName.get())
+            else:
+                self.renderCache.storeFile(key, fileName)
+        pending, self.duplicatePending = self.duplicatePending, []
+        for key, fileName in pending:
+            with open(fileName, 'wb') as f:
+                f.write(self.pendingKeys[key].get())
+        self.pendingKeys = {}
+        pending, self.encoderPending = self.encoderPending, []
+        for frame, frames in pending:
+            self.encoder.write(renderedFrame(frame), frames)
+        pending, self.listPending = self.listPending, []
+        for frame in pending:
+            self.visualizeList.append(renderedFrame(frame))
+        self.frameData = renderedFrame(self.frameData)
+
+    def setRenderCache(self, cacheDir=None, maxBytes=256*1024*1024):
+        # Method to keep each png image rendered by GraphViz in cacheDir, up to maxBytes, and to reuse it when the same frame
+        #    (same DOT text, GraphViz program and format) is rendered again, by this run or a later one: 
+        #    the cached image is hard linked (or copied) into the png image sequence, in place of running GraphViz.
+        #    Set cacheDir to None to stop using the cache. Hits and misses are counted, see renderCache.getStats().
+        self.flushGraph()
+        self.renderCache = None
+        if cacheDir != None:
+            self.renderCache = renderCache.renderCache(cacheDir, maxBytes)
+
+    def setVideoEncoder(self, videoFileName, writeImages=True, inputRate=1):
+        # Method to stream each png image into an FFmpeg video file, stored in fileDir, as soon as it is rendered.
+        #    Each image is held for vidFrames frames, at inputRate frames per second (as in png2mpg4.bat).
+        #    Set writeImages to False for video only, without writing png image files.
+        #    With render jobs (see setRenderJobs()), frames are rendered by the pool, and streamed in frame order by flushGraph().
+        #    Call finishVideo() at the end of the animation.
+        self.finishVideo()
+        self.encoder = videoEncoder.videoEncoder(self.fileDir + videoFileName, inputRate)
+        self.setWriteImages(writeImages)
+        
+    def finishVideo(self):
+        # Method to finish the video file started by setVideoEncoder(), once every frame queued for rendering is written
+        # Output: video file name, or None if no video was started
+        if not self.encoder:
+            return None
+        self.flushGraph()
+        videoFileName = self.encoder.close()
+        self.encoder = None
+        return videoFileName
+
+    def setHeadless(self, headless=True):
+        # Method to search without drawing nodes, edges, or png images: 
+        #    searchTree() still returns True or False, and counts the nodes visited in searchCount.
+        self.headless = headless
+
+    def clearGraph(self):
+        # Method to remove every node and edge drawn, keeping graph, node and edge defaults:
+        #    the graph is built again, so invisible placeholder nodes, and the edge defaults saved by draw(), are removed too
+        graph = self.graph
+        nodeDefaults = {}
+        for attributes in graph.get_node_defaults():
+            nodeDefaults.update(attributes)
+        edgeDefaults = graph.get_edge_defaults()[0]   # as restored by draw()
+        self.initGraph(graph_type=graph.get_graph_type(), **graph.get_attributes())
+        self.setNodeDefaults(**nodeDefaults)
+        self.setEdgeDefaults(**edgeDefaults)
+        assert [node.get_name() for node in self.graph.get_nodes()] == ['node', 'edge'], 'Error: graph not cleared'
+        self.nodeNames = {}
+        self.nodeStates = {}
+        self.sketchStates = {}
+        self.layoutCache = {}   # tree shape changed, layout must be computed again
+        self.raster = None
+        self.dotPrefix = None
+
+    def resetGraph(self):
+        # Method to return every node changed since the sketch to its sketched attributes,
+        #    keeping the nodes, edges and layout drawn, to search the same tree again without sketching it again
+        for name, sketch in self.sketchStates.items():
+            attributes = self.nodeNames[name].get_attributes()
+            for attribute, value in sketch.items():
+                if value == None:
+                    attributes.pop(attribute, None)
+                else:
+                    attributes[attribute] = value
+        self.nodeStates = {}
+        self.sketchStates = {}
+        self.dotPrefix = None   # the cached DOT text may hold changed attributes
+
+    def drawRotation(self, root, node):
+        # Method to animate one rotation of a self-balancing tree: 
+        #    draw the tree in its new shape, with the node at the top of the rotation highlighted in orange.
+        #    Pass as the onRotate function of binaryTree.avlTree's insert() and delete(), for example:
+        #        root.insert(value, lambda node: vT.drawRotation(root, node))
+        if self.headless:
+            return
+        self.clearGraph()
+        self.searchTree(root, sketchTree)
+        label = str(node)
+        self.setNodeState(label, fillcolor="orange")
+        self.updateGraph()
+        self.appendVisualizeList()
+        self.setNodeState(label, fillcolor="grey")
+
+    def searchTree(self, root, searchMethod, find=None, key=None):
         # Method to search a binary tree
         # Input:
         #     searchMethod is a helper function that defines the type of search to perform, 
         #        current examples implemented: DFS, BFS, and DFSOrdered
-        #     find is string representing the node to search and highlight, or None to display full binary tree 
+        #     find is the key of the node to search and highlight, or None to display full binary tree,
+        #        a string find is converted to the type of the root's key (example: '7' to 7 for a tree of integers)
+        #     key is an optional function applied to each node's key before comparing it with find (example: str.lower)
         # Output:
         #     True if node is found, or False if node is not found, or False when drawing the full tree (not searching)          
-        self.treeList = [root]
+        found = False
+        if find != None:
+            find = searchKey(find, key, root)
+        self.treeRoot = root
+        self.treeList = searchFrontier([root])
+        record = find is not None and (self.searchLog != None or not self.headless)
+        if record and self.searchLog != None:
+            self.searchLog.setTree(root)
+        self.searchCount = 0
         while len(self.treeList) > 0:
-            node = self.treeList.pop(0)
+            node = self.treeList.popleft()
             if node!=None:
                 #print str(node) # activate to display nodes searched when debug needed
-                if find==str(node):
-                    self.highlightNodeFound(str(node))
-                    return True
-                elif find!=None:
-                    self.blinkNodeTraversed(str(node))            
+                self.searchCount += 1
+                if find is not None and find==node.getValue():
+                    if record:
+                        self.playEvent('found', str(node), self.vidFrames)
+                    found = True
+                    break
+                elif find is not None and record:
+                    self.playEvent('visit', str(node), self.vidFrames)
                 searchMethod(node, self.treeList, find, self.draw)    
-        return False
+        if find is not None and not found and record:
+            self.playEvent('exhausted', None, 0)
+        # write any png images still queued for rendering (see setRenderJobs())
+        self.flushGraph()
+        return found
 
     def draw(self, parent_name, child_name=None, fill_color="grey", style_type='filled'):
         # Method to draw a node and an edge of a Binary Tree
@@ -160,10 +500,18 @@ class visualizeTree(object):
         #   child_name is a string lable identifying the child node to draw (or None, for a one node tree)
         #   fill_color is the color to fill nodes drawn
         #   style_type is either "filled" for normal drawing of tree nodes, or "invisible" for drawing nodes not part of tree          
+        if self.headless:
+            return
+        if style_type=="invisible" and self.layoutEngine=="native":
+            # placeholder nodes only guide dot's layout
+            return
         if not child_name:
             # Draw a tree with only one node
             self.nodeNames[parent_name] = pydot.Node(parent_name, label=parent_name, fillcolor=fill_color, style=style_type)
             self.graph.add_node(self.nodeNames[parent_name]) 
+            self.layoutCache = {}
+            self.raster = None
+            self.dotPrefix = None
             return            
                                       
         if style_type=="invisible":
@@ -177,6 +525,9 @@ class visualizeTree(object):
             weight_ = "3"
         edge = pydot.Edge(parent_name, child_name, style=style_type, weight=weight_)
         self.graph.add_edge(edge)  
+        self.layoutCache = {}   # tree shape changed, layout must be computed again
+        self.raster = None
+        self.dotPrefix = None
         if style_type=="invisible":
             # restore original edge defaults
             self.graph.set_edge_defaults(**saveEdgeDefaults)        
@@ -194,22 +545,169 @@ class visualizeTree(object):
             self.nodeNames[child_name] = pydot.Node(child_name, label=child_name, fillcolor=fill_color, style=style_type)
             self.graph.add_node(self.nodeNames[child_name])
                      
+    def setNodeState(self, name, **kwargs):
+        # Method to change attributes of a drawn node (example: fillcolor="red"), in place, in the node state table
+        #    and in the node's pydot object: each node is written once in the DOT text however often it changes,
+        #    so the DOT text of every frame has the same size.
+        node = self.nodeNames.get(name)
+        if node == None:
+            # a node not drawn by draw(): add it once
+            node = self.nodeNames[name] = pydot.Node(name, label=name)
+            self.graph.add_node(node)
+            self.dotPrefix = None
+        state = self.nodeStates.setdefault(name, {})
+        sketch = self.sketchStates.setdefault(name, {})
+        for attribute, value in kwargs.items():
+            if attribute not in sketch:
+                sketch[attribute] = node.get(attribute)
+            node.set(attribute, value)
+            if value == sketch[attribute]:
+                # back to the sketch's value
+                state.pop(attribute, None)
+            else:
+                state[attribute] = value
+        if not state:
+            del self.nodeStates[name]
+
+    def dotText(self):
+        # Method to return the DOT text of the current frame:
+        #    the graph's static structure (defaults, nodes, edges, invisible placeholders, pinned positions) is written by pydot once,
+        #    and cached, then each node changed since the sketch is written again with its current attributes, 
+        #    which override the attributes written before. Only these few node statements are formatted for each frame.
+        if self.dotPrefix == None:
+            text = self.graph.to_string().rstrip()
+            self.dotPrefix = text[:text.rindex('}')]
+        lines = [self.dotPrefix]
+        for name in sorted(self.sketchStates):
+            node = self.nodeNames[name]
+            attributes = ', '.join(['%s=%s' % (attribute, pydot.quote_if_necessary(str(node.get(attribute))))
+                                    for attribute in sorted(self.sketchStates[name])])
+            lines.append('%s [%s];\n' % (pydot.quote_if_necessary(name), attributes))
+        lines.append('}\n')
+        return ''.join(lines)
+
+    def frameDiff(self):
+        # Method to return the current frame as a diff against the sketch of the tree:
+        #    a dictionary of each changed node name (key) with its changed attributes (example: {'7': {'fillcolor': 'red'}})
+        return dict([(name, dict(state)) for name, state in self.nodeStates.items()])
+
+    def setSearchLog(self, log=True):
+        # Method to record each search and frame shown into a searchLog (see searchLog.py), off by default:
+        #    log is a searchLog object, True for a new empty log, or None to stop recording.
+        #    Call it before each search to record, a log holds the events of one tree (see searchLog.setTree()).
+        if log is True:
+            log = searchLog.searchLog()
+        self.searchLog = log
+
+    def playEvent(self, kind, label=None, frames=1):
+        # Method to record an event into the search log, and to render it unless headless
+        if self.searchLog != None:
+            self.searchLog.append(kind, label, frames)
+        if not self.headless:
+            self.renderEvent(kind, label, frames)
+
+    def renderEvent(self, kind, label=None, frames=1):
+        # Method to render one search log event, each png image held for frames video frames:
+        #    with frames set to 0, only the node state changes, and no png image is rendered
+        if frames <= 0:
+            if kind == 'visit':
+                self.setNodeState(label, fillcolor="#cc9999")
+            elif kind == 'found':
+                self.setNodeState(label, fillcolor="green")
+            return
+        vidFrames = self.vidFrames
+        self.vidFrames = frames
+        try:
+            if kind == 'visit':
+                self.blinkNodeTraversed(label)
+            elif kind == 'found':
+                self.highlightNodeFound(label)
+            elif kind == 'frame':
+                self.updateGraph()
+                self.appendVisualizeList()
+            elif kind == 'hold':
+                self.updateGraph()
+        finally:
+            self.vidFrames = vidFrames
+
+    def showFrame(self, frames=1):
+        # Method to add the current drawing to the animation and the visualizeList, held for frames video frames
+        self.playEvent('frame', None, frames)
+
+    def holdFrame(self, frames=1):
+        # Method to hold the current drawing in the video for frames video frames (example: at the end of the video)
+        self.playEvent('hold', None, frames)
+
+    def replaySearch(self, log, speed=1., frameBudget=None):
+        # Method to render a search log again, without searching: 
+        #    log is a searchLog object, or the name of a file written by searchLog.save(),
+        #    speed divides the frames each event is held for (example: 2. for a video twice as fast),
+        #    frameBudget, when set, scales the frames of every event so the whole replay fits in about frameBudget frames.
+        #    Frames are rounded with the rounding error carried to the next event, so short events are not all lost.
+        # Output:
+        #    number of video frames rendered
+        if isinstance(log, basestring):
+            log = searchLog.loadSearchLog(log)
+        recording, self.searchLog = self.searchLog, None
+        try:
+            root = log.getRoot()
+            self.clearGraph()
+            if root != None:
+                self.searchTree(root, sketchTree)
+            total = log.getFrameCount()
+            if frameBudget != None:
+                scale = float(frameBudget) / total if total else 0.
+            else:
+                scale = 1. / speed
+            wanted = 0.
+            rendered = 0
+            for kind, label, frames in log.events:
+                weight = searchLog.FRAME_WEIGHTS.get(kind, 1)
+                wanted += frames * scale * weight
+                frames = max(0, int(round(wanted - rendered)) // weight)
+                rendered += frames * weight
+                self.renderEvent(kind, label, frames)
+            self.flushGraph()
+        finally:
+            self.searchLog = recording
+        return rendered
+
     def highlightNodeFound(self, node):
         # Method to animate the found node in a search tree         
-        self.graph.add_node(pydot.Node(node, fillcolor="green"))
+        self.setNodeState(node, fillcolor="green")
         self.updateGraph() 
         self.appendVisualizeList()
         
     def appendVisualizeList(self):
-        self.visualizeList.append(self.fullFileName)    
+        if not self.writeImages:
+            # no png image file was written, hold the frame itself for display
+            if self.listPending or isinstance(self.frameData, frameRenderer.renderedImage):
+                # still rendering, keep frame order (see flushGraph())
+                self.listPending.append(self.frameData)
+            else:
+                self.visualizeList.append(self.frameData)
+        else:
+            self.visualizeList.append(self.fullFileName)    
+
+    def setFrameStore(self, memoryBudget=None, spillDir=None, encoded=False):
+        # Method to hold the visualizeList frames rendered in memory (see setWriteImages()), up to memoryBudget bytes.
+        #    Past the budget, the oldest frames are written to spillDir (a temporary directory when None),
+        #    set encoded to True to hold frames as png image data: several times smaller, but decoded on every read.
+        #    Call before the first appendVisualizeList().
+        self.visualizeList = frameStore.frameStore(memoryBudget, spillDir, encoded)
+
+    def setWriteImages(self, writeImages):
+        # Method to write png image files (the default), or set to False to keep frames in memory only:
+        #    streamed to the video encoder (see setVideoEncoder()), and held in the visualizeList (see setFrameStore())
+        self.writeImages = writeImages
   
     def blinkNodeTraversed(self, node):
         # Method to animate a node being traversed in a search tree  
-        self.graph.add_node(pydot.Node(node, fillcolor="red"))
+        self.setNodeState(node, fillcolor="red")
         self.updateGraph()
         self.appendVisualizeList()
         # use a redish grey color #cc9999 to show a breadcrumb to searched nodes in tree
-        self.graph.add_node(pydot.Node(node, fillcolor="#cc9999"))
+        self.setNodeState(node, fillcolor="#cc9999")
         self.updateGraph()        
              
     def setFileName(self):
@@ -229,11 +727,143 @@ class visualizeTree(object):
         return self.fileCount
     
     def updateGraph(self):
-        # Method to write multiple copies of the same png image in support of ffmpeg png to video batch file        
+        # Method to write multiple copies of the same png image in support of ffmpeg png to video batch file,
+        #    or with a frame manifest, to write the png image once and record the number of frames to hold it,
+        #    and with a video encoder, to stream the png image into the video for vidFrames frames
+        #    With render jobs (see setRenderJobs()), frames are queued, and streamed to the encoder by flushGraph()
+        imageData = None
+        if self.renderBackend == 'pillow':
+            imageData = self.rasterGraph()
+        elif not self.writeImages or (self.encoder and not self.renderer):
+            imageData = self.createGraph()
+        self.frameData = imageData
+        if not self.writeImages:
+            self.encodeFrame(imageData)
+            return
+        if self.useFrameManifest:
+            self.fileCount += 1
+            self.setFileName()
+            image = self.writeGraph(self.fullFileName, imageData)
+            self.frameManifest.append((self.fullFileName, self.vidFrames))
+            self.encodeFrame(imageData if imageData != None else image)
+            return
         for i in range(0, self.vidFrames):
             self.fileCount += 1
             self.setFileName()
-            self.graph.write_png(self.fullFileName)   
+            image = self.writeGraph(self.fullFileName, imageData)
+            if i == 0:
+                firstImage = image
+        if self.vidFrames > 0:
+            self.encodeFrame(imageData if imageData != None else firstImage)
+
+    def createGraph(self):
+        # Method to render the current graph into memory: png image data, 
+        #    or a frameRenderer.renderedImage when queued for rendering (see setRenderJobs())
+        prog = self.graphProg()   # first, it may compute the layout cache
+        dotData = self.dotText()
+        key = None
+        if self.renderCache:
+            key = self.renderCache.key(dotData, prog, 'png')
+            if key in self.pendingKeys:
+                # same frame already queued for rendering, counted as a cache hit
+                self.renderCache.hits += 1
+                return self.pendingKeys[key]
+            imageData = self.renderCache.read(key)
+            if imageData != None:
+                return imageData
+        if self.renderer:
+            imageData = self.renderer.create(dotData, prog, 'png')
+            if key:
+                # cached once rendered, see flushGraph()
+                self.cachePending.append((key, imageData))
+                self.pendingKeys[key] = imageData
+        else:
+            imageData = frameRenderer.createDot(dotData, prog, 'png')
+            if key:
+                self.renderCache.store(key, imageData)
+        return imageData
+
+    def encodeFrame(self, frame):
+        # Method to stream a frame into the video encoder for vidFrames frames: png image data, an image,
+        #    or a frameRenderer.renderedImage, queued until flushGraph() to keep frame order
+        if not self.encoder:
+            return
+        if self.encoderPending or isinstance(frame, frameRenderer.renderedImage):
+            self.encoderPending.append((frame, self.vidFrames))
+        else:
+            self.encoder.write(frame, self.vidFrames)
+
+    def graphProg(self):
+        # Method to return the GraphViz program used to render frames: 
+        #    dot, or neato with node positions pinned by the layout cache (see setLayoutCache())
+        if self.useLayoutCache:
+            if not self.layoutCache:
+                self.cacheLayout()
+            return ['neato', '-n2']
+        return 'dot'
+
+    def writeGraph(self, fileName, imageData=None):
+        # Method to render the current graph as a png image, or queue it for rendering (see setRenderJobs()),
+        #    or to write imageData when the frame was already rendered: png image data, or an image from rasterGraph()
+        # Output: frameRenderer.renderedImage of the png image written, or queued for rendering
+        if os.path.exists(fileName):
+            # the file may be a hard link to a cached image (see setRenderCache()): replace the file, not its contents
+            os.remove(fileName)
+        if isinstance(imageData, basestring):
+            with open(fileName, 'wb') as f:
+                f.write(imageData)
+            return frameRenderer.renderedImage(fileName)
+        elif imageData != None:
+            imageData.save(fileName, 'PNG')
+            return frameRenderer.renderedImage(fileName)
+        prog = self.graphProg()
+        dotData = self.dotText()
+        key = None
+        if self.renderCache:
+            key = self.renderCache.key(dotData, prog, 'png')
+            if key in self.pendingKeys:
+                # same frame already queued for rendering (example: a frame held for vidFrames png images),
+                #    rendered once and copied by flushGraph(), counted as a cache hit
+                self.renderCache.hits += 1
+                self.duplicatePending.append((key, fileName))
+                return frameRenderer.renderedImage(fileName)
+            if self.renderCache.link(key, fileName):
+                return frameRenderer.renderedImage(fileName)
+        if self.renderer:
+            image = self.renderer.render(dotData, fileName, prog)
+            if key:
+                # cached once written, see flushGraph()
+                self.cachePending.append((key, fileName))
+                self.pendingKeys[key] = image
+            return image
+        frameRenderer.renderDot(dotData, fileName, prog)
+        if key:
+            self.renderCache.storeFile(key, fileName)
+        return frameRenderer.renderedImage(fileName)
+
+
+def renderedFrame(frame):
+    # Return a frame's image data once rendered, when the frame is a frameRenderer.renderedImage (see setRenderJobs())
+    if isinstance(frame, frameRenderer.renderedImage):
+        return frame.get()
+    return frame
+
+
+class searchFrontier(deque):
+    # Search frontier for searchTree(): nodes waiting to be searched, next node on the left.
+    #    appendleft(), append(), and popleft() take constant time, however large the frontier grows.
+    def insert(self, index, node):
+        # Support search functions written for a list frontier, insert(0, node) takes constant time
+        if index < 0:
+            index = max(0, index + len(self))
+        if index == 0:
+            self.appendleft(node)
+        elif index >= len(self):
+            self.append(node)
+        else:
+            self.rotate(-index)
+            self.appendleft(node)
+            self.rotate(index)
 
 
 # Helper search functions for use with visualizeTree's method named "searchTree()"
@@ -248,9 +878,9 @@ def DFS(node, queue, find=None, draw=None):
     #     queue: First in First out (FIFO) ,
     #     find and draw: Unused. 
     if node.getRightBranch():
-        queue.insert(0, node.getRightBranch())
+        queue.appendleft(node.getRightBranch())
     if node.getLeftBranch():
-        queue.insert(0, node.getLeftBranch())   
+        queue.appendleft(node.getLeftBranch())   
             
 def DFSOrdered(node, queue, find, draw=None):
     # Ordered Depth First Search helper function for binaryTree.searchTree(): 
@@ -259,13 +889,13 @@ def DFSOrdered(node, queue, find, draw=None):
     # Input:
     #     node: Current node in binary tree,
     #     queue: First in First out (FIFO) ,
-    #     find: the string value we are searching for in a tree,
+    #     find: the key we are searching for in a tree (a searchKey, compared with node keys in their own type),
     #     draw: Unused.       
     if node:                                                        
-        if node.getRightBranch() and find > str(node.getValue()):
-            queue.insert(0, node.getRightBranch())
-        if node.getLeftBranch() and find < str(node.getValue()):
-            queue.insert(0, node.getLeftBranch())        
+        if node.getRightBranch() and find > node.getValue():
+            queue.appendleft(node.getRightBranch())
+        if node.getLeftBranch() and find < node.getValue():
+            queue.appendleft(node.getLeftBranch())        
 
 def BFS(node, stack, find=None, draw=None):
     # Breadth First Search helper function for binaryTree.searchTree(): 
@@ -285,21 +915,86 @@ def BFS(node, stack, find=None, draw=None):
 # Input: node in binary tree, stack for depth first drawing
 # Unused: find
 def sketchTree(node, stack, find=None, draw=None):
-    if node.getLeftBranch():
-        draw(str(node), str(node.getLeftBranch()))
-        stack.append(node.getLeftBranch()) 
-        if node.getRightBranch():
+    label = str(node)
+    left = node.getLeftBranch()
+    right = node.getRightBranch()
+    if left:
+        draw(label, str(left))
+        stack.append(left) 
+        if right:
             # insert invisible third node in-between left and right nodes
-            draw(str(node), ":"+str(node), style_type="invisible")
-    elif node.getRightBranch():
+            draw(label, ":"+label, style_type="invisible")
+    elif right:
         # draw any missing left branches as invisible nodes/edges with dummy unique labels 
-        draw(str(node), ":"+str(node), style_type="invisible")
-    if node.getRightBranch():
-        draw(str(node), str(node.getRightBranch()))
-        stack.append(node.getRightBranch())      
-    elif node.getLeftBranch():
+        draw(label, ":"+label, style_type="invisible")
+    if right:
+        draw(label, str(right))
+        stack.append(right)      
+    elif left:
         # draw any missing right branches as invisible nodes/edges with dummy unique labels 
-        draw(str(node), ";"+str(node), style_type="invisible")
-    if not node.getLeftBranch() and not node.getRightBranch() and not node.getParent():
+        draw(label, ";"+label, style_type="invisible")
+    if not left and not right and not node.getParent():
         # special case: draw a tree with only one node
-        draw(str(node))
+        draw(label)
+
+
+# Node keys
+# ---------
+
+class searchKey(object):
+    # The key searched for by searchTree(), compared with node keys (find > node.getValue()) in their own type,
+    #    so integer keys compare as integers ("10" < "9", but 9 < 10).
+    #    key is an optional function applied to each node key before comparing (as the key argument of python's sorted()).
+    __slots__ = ('find', 'key')
+
+    def __init__(self, find, key=None, root=None):
+        if isinstance(find, searchKey):
+            find, key = find.find, find.key
+        elif isinstance(find, basestring) and key == None and root != None and not isinstance(root.getValue(), basestring):
+            # find typed as text, for a tree of numbers (example: findValue = '7')
+            try:
+                find = type(root.getValue())(find)
+            except (TypeError, ValueError):
+                pass
+        self.find = find
+        self.key = key
+
+    def keyOf(self, value):
+        if self.key == None:
+            return value
+        return self.key(value)
+
+    def compared(self, value):
+        # Return (find, value) to compare: as strings when value is a string and find is not,
+        #    for search functions written to compare find with str(node.getValue())
+        value = self.keyOf(value)
+        if isinstance(value, basestring) and not isinstance(self.find, basestring):
+            return (str(self.find), value)
+        return (self.find, value)
+
+    def __eq__(self, value):
+        find, value = self.compared(value)
+        return find == value
+
+    def __ne__(self, value):
+        find, value = self.compared(value)
+        return find != value
+
+    def __lt__(self, value):
+        find, value = self.compared(value)
+        return find < value
+
+    def __gt__(self, value):
+        find, value = self.compared(value)
+        return find > value
+
+    def __le__(self, value):
+        find, value = self.compared(value)
+        return find <= value
+
+    def __ge__(self, value):
+        find, value = self.compared(value)
+        return find >= value
+
+    def __str__(self):
+        return str(self.find)